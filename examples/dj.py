@@ -23,12 +23,15 @@ def deutsch_jozsa(n: int = 3, oracle_type: str = "balanced"):
     qreg = qpu.qregister(n + 1)
     creg = CRegister(n)
 
+    h, x, cx = qpu.isa.h, qpu.isa.x, qpu.isa.cx
+    inputs = list(range(n))
+
     with Circuit(qreg, creg, qpu, shots=1000) as c:
-        for i in range(n):
-            c >> qpu.isa.h(tg=i)
+        for i in inputs:
+            c >> h(tg=i)
 
-        c >> qpu.isa.x(tg=n)
-        c >> qpu.isa.h(tg=n)
+        c >> x(tg=n)
+        c >> h(tg=n)
 
         if oracle_type == "constant":
             # Nothing to be done for identity function
@@ -36,19 +39,20 @@ def deutsch_jozsa(n: int = 3, oracle_type: str = "balanced"):
 
         elif oracle_type == "balanced":
             # Standard XOR oracle
-            for i in range(n):
-                c >> qpu.isa.cx(ct=i, tg=n)
+            for i in inputs:
+                c >> cx(ct=i, tg=n)
         else:
             raise ValueError("oracle_type must be 'constant' or 'balanced'")
 
-        for i in range(n):
-            c >> qpu.isa.h(tg=i)
+        for i in inputs:
+            c >> h(tg=i)
 
-        c >> qpu.isa.measure(tgs=list(range(n)))
+        c >> qpu.isa.measure(tgs=inputs)
 
-    result = creg.frequencies()
+    counts = creg.counts_array()
 
-    if all(outcome == "0" * n for outcome in result):
+    # Constant oracles only ever yield the all-zeros outcome (index 0)
+    if counts[0] == counts.sum():
         print("Oracle function is constant.")
     else:
         print("Oracle function is balanced.")
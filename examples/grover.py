@@ -10,65 +10,76 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 import numpy as np
+
 from lccfq_lang import QPU, CRegister, Circuit
 
 
+def grover_iteration(isa, marked_bits, n_qubits):
+    """Build the fixed oracle + diffuser block of one Grover iteration. The
+    block is identical in every iteration, so callers build it once and tile it.
+
+    :param isa: instruction set architecture instance
+    :param marked_bits: marked bitstring as a tuple, least significant bit first
+    :param n_qubits: number of qubits
+    :return: tuple of instructions for a single iteration
+    """
+    h, x, cx = isa.h, isa.x, isa.cx
+    qubits = range(n_qubits)
+
+    # Multi-controlled-Z via H+CX ladder, shared by oracle and diffuser
+    mcz = [
+        h(tg=3),
+        cx(ct=2, tg=3),
+        cx(ct=1, tg=2),
+        cx(ct=0, tg=1),
+        x(tg=0),
+        cx(ct=1, tg=0),
+        x(tg=0),
+        cx(ct=0, tg=1),
+        cx(ct=1, tg=2),
+        cx(ct=2, tg=3),
+        h(tg=3),
+    ]
+    flips = [x(tg=i) for i, bit in enumerate(marked_bits) if bit == 0]
+
+    block = flips + mcz + flips
+
+    for q in qubits:
+        block.append(h(tg=q))
+        block.append(x(tg=q))
+
+    block.extend(mcz)
+
+    for q in qubits:
+        block.append(x(tg=q))
+        block.append(h(tg=q))
+
+    return tuple(block)
+
+
 def grover():
     qpu = QPU(filename="config/default.toml")
     qreg = qpu.qregister(4)
     creg = CRegister(4)
 
     marked_bitstring = "1010"
-    marked_bits = [int(b) for b in reversed(marked_bitstring)]
+    marked_bits = tuple(int(b) for b in reversed(marked_bitstring))
     n_qubits = 4
     n_iterations = int(round((np.pi / 4) * np.sqrt(2**n_qubits)))
 
+    isa = qpu.isa
+    qubits = list(range(n_qubits))
+
+    # The iteration block is identical every time, so build it once
+    block = grover_iteration(isa, marked_bits, n_qubits)
+
     with Circuit(qreg, creg, qpu, shots=1000) as c:
-        for q in range(n_qubits):
-            c >> qpu.isa.h(tg=q)
-
-        for _ in range(n_iterations):
-            for i, bit in enumerate(marked_bits):
-                if bit == 0:
-                    c >> qpu.isa.x(tg=i)
-
-            c >> qpu.isa.h(tg=3)
-            c >> qpu.isa.cx(ct=2, tg=3)
-            c >> qpu.isa.cx(ct=1, tg=2)
-            c >> qpu.isa.cx(ct=0, tg=1)
-            c >> qpu.isa.x(tg=0)
-            c >> qpu.isa.cx(ct=1, tg=0)
-            c >> qpu.isa.x(tg=0)
-            c >> qpu.isa.cx(ct=0, tg=1)
-            c >> qpu.isa.cx(ct=1, tg=2)
-            c >> qpu.isa.cx(ct=2, tg=3)
-            c >> qpu.isa.h(tg=3)
-
-            for i, bit in enumerate(marked_bits):
-                if bit == 0:
-                    c >> qpu.isa.x(tg=i)
-
-            for q in range(n_qubits):
-                c >> qpu.isa.h(tg=q)
-                c >> qpu.isa.x(tg=q)
-
-            c >> qpu.isa.h(tg=3)
-            c >> qpu.isa.cx(ct=2, tg=3)
-            c >> qpu.isa.cx(ct=1, tg=2)
-            c >> qpu.isa.cx(ct=0, tg=1)
-            c >> qpu.isa.x(tg=0)
-            c >> qpu.isa.cx(ct=1, tg=0)
-            c >> qpu.isa.x(tg=0)
-            c >> qpu.isa.cx(ct=0, tg=1)
-            c >> qpu.isa.cx(ct=1, tg=2)
-            c >> qpu.isa.cx(ct=2, tg=3)
-            c >> qpu.isa.h(tg=3)
-
-            for q in range(n_qubits):
-                c >> qpu.isa.x(tg=q)
-                c >> qpu.isa.h(tg=q)
-
-        c >> qpu.isa.measure(tgs=list(range(n_qubits)))
+        c.extend(isa.h(tg=q) for q in qubits)
+
+        # Tile all iterations up front and append them in a single batch
+        c.extend(block * n_iterations)
+
+        c >> isa.measure(tgs=qubits)
 
     print(creg.frequencies())
 
@@ -9,6 +9,8 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import numpy as np
+
 from lccfq_lang import QPU, CRegister, Circuit, Test, QASMSynthesizer
 
 
@@ -20,7 +22,7 @@ def quantum_teleportation():
     """
     qpu = QPU(filename="config/default.toml", last_pass="transpiled")
     qreg = qpu.qregister(3)
-    creg = CRegister(2)
+    creg = CRegister(3)
 
     # Setup:
     #
@@ -45,9 +47,13 @@ def quantum_teleportation():
     synth = QASMSynthesizer()
     synth.synth_circuit(circuit=c, path="./teleport.qasm")
 
-    freqs = creg.frequencies()
-    corrected = postprocess(freqs)
-    print(corrected)
+    counts = creg.counts_array()
+
+    # Circuits stopped before execution fill the register with -1 placeholders
+    if (counts < 0).any():
+        print("Circuit not executed: no counts to post-process")
+    else:
+        print(postprocess(counts))
 
     tests = {}
 
@@ -69,34 +75,22 @@ def quantum_teleportation():
 
 
 
-def postprocess(freqs: dict) -> dict:
+def postprocess(counts: np.ndarray) -> dict:
     """Post-processing code to apply corrections to Bob's qubit.
 
-    :param freqs: frequencies returned after successful quantum teleportation protocol
+    :param counts: non-negative counts indexed by the packed outcome (q2, c1, c0),
+        with q2 as the most significant bit; they weight the histogram, so
+        placeholders of unexecuted circuits (-1) must not be passed in
     :return: corrected frequencies after postprocessing
     """
-    corrected = {"0": 0, "1": 0}
-
-    for outcome, count in freqs.items():
-        if len(outcome) != 3:
-            continue
-
-        q2_bit = int(outcome[0])
-        c1 = int(outcome[1])
-        c0 = int(outcome[2])
-        result = q2_bit
-
-        # c1 == 1 -> X(outcome)
-        if c1 == 1:
-            result ^= 1
-
-        # c0 == 1 -> Z(outcome)
-        if c0 == 1:
-            result ^= 1
+    packed = np.arange(len(counts), dtype=np.uint8)
 
-        corrected[str(result)] += count
+    # c1 == 1 -> X(outcome), c0 == 1 -> Z(outcome); XOR the three bits
+    # branchlessly and mask once
+    corrected = ((packed >> 2) ^ (packed >> 1) ^ packed) & 1
+    totals = np.bincount(corrected, weights=counts, minlength=2)
 
-    return corrected
+    return {"0": int(totals[0]), "1": int(totals[1])}
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
-import random
+import os
 import numpy as np
 
 from collections import Counter
@@ -18,83 +18,69 @@ from xeb_util import XEBSimulator
 from lccfq_lang import QPU, CRegister, Circuit
 
 
-def random_sqg(isa, qidx):
-    """Yield a random single-qubit instruction
+# Single-qubit gates sampled by the random circuit, indexed by opcode
+SQG_NAMES = ("x", "y", "z", "h", "s", "t")
 
-    :param isa: instruction set architecture instance
-    :param qidx: target qubit index
-    :return: random instruction
-    """
-    gates = [isa.x, isa.y, isa.z, isa.h, isa.s, isa.t]
-    return random.choice(gates)(tg=qidx)
-
-
-def random_tqg(isa, qidx0, qidx1):
-    """Yield a random CX instruction with two qubits.
-
-    :param isa: instruction set architecture instance
-    :param qidx0: qubit index 0
-    :param qidx1: qubit index 1
-
-    :return: CX instruction
-    """
-    if random.choice([True, False]):
-        return isa.cx(ct=qidx0, tg=qidx1)
-    else:
-        return isa.cx(ct=qidx1, tg=qidx0)
 
-
-def generate_rand_inst(n_qubits, depth, isa):
+def generate_rand_inst(n_qubits, depth, isa, seed=None):
     """ Generate a random instructions using single- and two-qubit instructions.
 
+    All random choices (single-qubit gates, CX orientations and the order of the
+    pairs in each two-qubit layer) are drawn up front in one NumPy call each.
+
     :param n_qubits: number of qubits
     :param depth: circuit depth in 1:2-qubit layers
     :param isa: instruction set architecture instance
+    :param seed: optional seed for reproducible circuits
     :return: circuit
     """
+    rng = np.random.default_rng(seed)
+    sqg = [getattr(isa, name) for name in SQG_NAMES]
+    cx = isa.cx
+
+    pairs = list(zip(range(0, n_qubits - 1, 2), range(1, n_qubits, 2)))
+    n_pairs = len(pairs)
+
+    sq_opcodes = rng.integers(0, len(sqg), size=(depth, n_qubits)).tolist()
+    cx_flips = rng.integers(0, 2, size=(depth, n_pairs)).tolist()
+    pair_order = rng.permuted(np.tile(np.arange(n_pairs), (depth, 1)), axis=1).tolist()
+
     circuit = []
 
     for layer in range(depth):
         # single-qubit layer
-        for q in range(n_qubits):
-            circuit.append(random_sqg(isa, q))
+        circuit.extend(sqg[op](tg=q) for q, op in enumerate(sq_opcodes[layer]))
 
         # two-qubit layer
-        pairs = list(zip(range(0, n_qubits - 1, 2), range(1, n_qubits, 2)))
-        random.shuffle(pairs)
-
-        for q0, q1 in pairs:
-            circuit.append(random_tqg(isa, q0, q1))
+        for p, flip in zip(pair_order[layer], cx_flips[layer]):
+            q0, q1 = pairs[p]
+            circuit.append(cx(ct=q1, tg=q0) if flip else cx(ct=q0, tg=q1))
 
     return circuit
 
 
-def compute_xeb(result: dict, ideal_probs: dict, n_qubits: int) -> float:
-    """Compute the XEB fidelity.
+def compute_xeb(counts: np.ndarray, ideal_probs: np.ndarray, n_qubits: int) -> float:
+    """Compute the XEB fidelity as a single dot product over outcome-indexed
+    arrays.
 
-    :param result: result computed through RCS
-    :param ideal_probs: expected probability distribution
+    :param counts: measured counts per outcome, indexed by bitstring value
+    :param ideal_probs: expected probability distribution, same indexing
     :param n_qubits: number of qubits
     :return: fidelity
     """
-    total = sum(result.values())
-    sum_probs = 0.0
-
-    for bitstring, count in result.items():
-        p = ideal_probs.get(bitstring, 0)
-        sum_probs += p * count
+    # Cast the counts once so the reduction runs as a BLAS ddot
+    average_p = float(np.dot(counts.astype(np.float64), ideal_probs)) / counts.sum()
+    return (1 << n_qubits) * average_p - 1.0
 
-    average_p = sum_probs / total
-    fidelity = (2**n_qubits) * average_p - 1
-    return fidelity
 
-
-def xeb_rcs(n_qubits=4, depth=20, shots=1000):
+def xeb_rcs(n_qubits=4, depth=20, shots=1000, ideal=False):
     """Obtain the XEB fidelity using random circuit sampling.
 
     :param n_qubits: number of qubits
     :param depth: number of 1:2-qubit layers
     :param shots: number of shots
+    :param ideal: replace device results with shots sampled from the ideal
+        simulator, which gives a noiseless reference fidelity
     :return:
     """
     qpu = QPU(filename="config/default.toml")
@@ -108,13 +94,17 @@ def xeb_rcs(n_qubits=4, depth=20, shots=1000):
             c >> gate
         c >> qpu.isa.measure(tgs=list(range(n_qubits)))
 
-    result = creg.frequencies()
-
     # Use an internal state vector to simulate the resulting probabilities
-    ideal_probs = XEBSimulator().probabilities(rcs_circuit, n_qubits)
+    sim = XEBSimulator()
+    ideal_probs = sim.probabilities(rcs_circuit, n_qubits)
+
+    if ideal:
+        creg.absorb_shots(sim.sample(ideal_probs, shots, workers=os.cpu_count() or 1))
+
+    counts = creg.counts_array()
 
     # Contrast against
-    fidelity = compute_xeb(result, ideal_probs, n_qubits)
+    fidelity = compute_xeb(counts, ideal_probs, n_qubits)
 
-    print("Ideal circuit frequencies:", result)
+    print("Measured circuit frequencies:", creg.frequencies())
     print("XEB fidelity:", fidelity)
\ No newline at end of file
@@ -10,102 +10,180 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import os
 import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+
 from lccfq_lang.arch.instruction import Instruction
 
 
+# Single-qubit gates understood by the simulator
+GATES = {
+    "h": (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]]),
+    "x": np.array([[0, 1], [1, 0]]),
+    "y": np.array([[0, -1j], [1j, 0]]),
+    "z": np.array([[1, 0], [0, -1]]),
+    "s": np.array([[1, 0], [0, 1j]]),
+    "t": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]])
+}
+
+
+def array_module(backend: str = None):
+    """Select the array library used for the state vector. CuPy is used when
+    requested (argument or LCCFQ_BACKEND=cupy) and importable; otherwise the
+    simulator falls back to NumPy.
+
+    :param backend: "numpy" or "cupy"; defaults to the LCCFQ_BACKEND variable
+    :return: array module
+    """
+    backend = backend or os.environ.get("LCCFQ_BACKEND", "numpy")
+
+    if backend == "cupy":
+        try:
+            import cupy
+            return cupy
+        except ImportError:
+            pass
+
+    return np
+
+
 class XEBSimulator:
     """A barebones simulator for XEB that produces probabilities based on a
-    random circuit sampling. We note this is not scalable for large qubit counts.
+    random circuit sampling. The state vector is kept as an n-dimensional
+    tensor so each gate touches O(2^n) amplitudes, and can live on a GPU when
+    CuPy is available. We note this is still not scalable for large qubit counts.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, backend: str = None, dtype=np.complex64):
+        """Single precision is enough for XEB fidelities and halves the memory
+        traffic of every gate application on the state vector.
 
-    @staticmethod
-    def _apply_virtual_sqg(state, gate: np.ndarray, target: int, n_qubits: int):
+        :param backend: array backend, see `array_module`
+        :param dtype: complex type of the amplitudes and gate matrices
+        """
+        self.xp = array_module(backend)
+        self.dtype = dtype
+        self.gates = {k: self.xp.asarray(v, dtype=dtype) for k, v in GATES.items()}
+
+    def _apply_virtual_sqg(self, psi, gate, target: int, n_qubits: int):
         """Simulated single-qubit gate.
 
-        :param state: vector state
-        :param gate: numpy gate
+        :param psi: state tensor of shape (2,) * n_qubits
+        :param gate: 2x2 gate matrix
         :param target: target qubit
         :param n_qubits: number of qubits
-        :return: resulting state
+        :return: resulting state tensor
         """
-        I = np.eye(2)
-        op = 1
-        for i in reversed(range(n_qubits)):
-            op = np.kron(op, gate if i == target else I)
-        return op @ state
+        axis = n_qubits - 1 - target
+        out = self.xp.tensordot(gate, psi, axes=([1], [axis]))
+        return self.xp.moveaxis(out, 0, axis)
 
-    @staticmethod
-    def _apply_virtual_cx(state, control: int, target: int, n_qubits: int):
-        """ Simulated CX gate
+    def _apply_virtual_cx(self, psi, control: int, target: int, n_qubits: int):
+        """Simulated CX gate, flipping the target axis of the control=1 slice.
 
-        :param state: vector state
+        :param psi: state tensor of shape (2,) * n_qubits
         :param control: control qubit index
         :param target: target qubit index
         :param n_qubits: number of qubits
-        :return: resulting state
+        :return: resulting state tensor
         """
-        dim = 2 ** n_qubits
-        new_state = np.copy(state)
-
-        for i in range(dim):
-            b = format(i, f"0{n_qubits}b")
-            if b[n_qubits - 1 - control] == '1':
-                flipped = list(b)
-                tbit = n_qubits - 1 - target
-                flipped[tbit] = '0' if b[tbit] == '1' else '1'
-                j = int("".join(flipped), 2)
-                new_state[j] += state[i]
-                new_state[i] = 0
-            else:
-                new_state[i] += state[i]
-
-        return new_state
-
-    def _apply_virtual_instruction(self, state, instr: Instruction, n_qubits: int):
+        c_axis = n_qubits - 1 - control
+        t_axis = n_qubits - 1 - target
+
+        idx = [slice(None)] * n_qubits
+        idx[c_axis] = 1
+        idx = tuple(idx)
+
+        # The control axis disappears from the slice
+        sub_axis = t_axis - 1 if t_axis > c_axis else t_axis
+
+        psi = psi.copy()
+        psi[idx] = self.xp.flip(psi[idx], axis=sub_axis).copy()
+        return psi
+
+    def _apply_virtual_instruction(self, psi, instr: Instruction, n_qubits: int):
         """Simulate an arbitrary instruction.
 
-        :param state: vector state
+        :param psi: state tensor
         :param instr: instruction
         :param n_qubits: number of qubits
-        :return: resulting state
+        :return: resulting state tensor
         """
-        gate_numeric = {
-            "h": (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]]),
-            "x": np.array([[0, 1], [1, 0]]),
-            "y": np.array([[0, -1j], [1j, 0]]),
-            "z": np.array([[1, 0], [0, -1]]),
-            "s": np.array([[1, 0], [0, 1j]]),
-            "t": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]])
-        }
-
-        if instr.symbol in gate_numeric:
-            gate = gate_numeric[instr.symbol]
-            return self._apply_virtual_sqg(state, gate, instr.target_qubits[0], n_qubits)
+        if instr.symbol in self.gates:
+            return self._apply_virtual_sqg(psi, self.gates[instr.symbol], instr.target_qubits[0], n_qubits)
 
         elif instr.symbol == "cx":
-            return self._apply_virtual_cx(state, instr.control_qubits[0], instr.target_qubits[0], n_qubits)
+            return self._apply_virtual_cx(psi, instr.control_qubits[0], instr.target_qubits[0], n_qubits)
 
         else:
-            return state
+            return psi
 
     def probabilities(self, circuit, n_qubits):
         """Estimate probabilities from ideal realization.
 
         :param circuit: circuit to simulate
         :param n_qubits: number of qubits
-        :return: probabilities generated by the circuit
+        :return: probabilities generated by the circuit, indexed by the
+            integer value of each bitstring
+        """
+        xp = self.xp
+        psi = xp.zeros((2,) * n_qubits, dtype=self.dtype)
+        psi[(0,) * n_qubits] = 1.0  # |000...0⟩
+
+        for instr in circuit:
+            psi = self._apply_virtual_instruction(psi, instr, n_qubits)
+
+        # |a|^2 straight from the single-precision components, skipping the
+        # square root in abs()
+        amps = psi.reshape(-1)
+        probs = amps.real * amps.real + amps.imag * amps.imag
+
+        if xp is not np:
+            probs = xp.asnumpy(probs)
+
+        return probs.astype(np.float64)
+
+    def unitary(self, circuit, n_qubits):
+        """Collapse a gate sequence into its dense unitary by pushing all basis
+        states through the circuit at once (one trailing batch axis).
+
+        :param circuit: gate sequence to fuse
+        :param n_qubits: number of qubits
+        :return: 2^n x 2^n matrix, as a NumPy array
         """
-        dim = 2 ** n_qubits
-        state = np.zeros(dim, dtype=complex)
-        state[0] = 1.0  # |000...0⟩
+        xp = self.xp
+        dim = 1 << n_qubits
+        psi = xp.eye(dim, dtype=self.dtype).reshape((2,) * n_qubits + (dim,))
 
         for instr in circuit:
-            state = self._apply_virtual_instruction(state, instr, n_qubits)
+            psi = self._apply_virtual_instruction(psi, instr, n_qubits)
+
+        u = psi.reshape(dim, dim)
+        return xp.asnumpy(u) if xp is not np else u
+
+    @staticmethod
+    def sample(probs: np.ndarray, shots: int, seed=None, workers: int = 1) -> np.ndarray:
+        """Draw ideal measurement outcomes from a probability vector. Shots are
+        split across independent PCG64 streams spawned from a single seed, one
+        per worker thread, so results are reproducible for a fixed seed and
+        worker count.
+
+        :param probs: outcome probabilities indexed by bitstring value
+        :param shots: number of shots
+        :param seed: seed for the root SeedSequence
+        :param workers: number of threads sampling in parallel
+        :return: packed outcomes, one per shot
+        """
+        probs = np.asarray(probs, dtype=np.float64)
+        probs = probs / probs.sum()
+
+        rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(workers)]
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(shots), workers)]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(lambda r, k: r.choice(len(probs), size=k, p=probs), rngs, sizes)
+            outcomes = np.concatenate(list(chunks))
 
-        probs = np.abs(state) ** 2
-        bitstrings = [format(i, f"0{n_qubits}b") for i in range(dim)]
-        return dict(zip(bitstrings, probs))
\ No newline at end of file
+        return outcomes.astype(np.uint64)
@@ -2,41 +2,65 @@
 Filename: __init__.py
 Author: Santiago Nunez-Corrales
 Date: 2026-05-14
-Version: 1.1
+Version: 1.2
 Description:
     This file selectively exposes a curated interface for user-level programming with
     lccfq_lang. Phase 5 adds re-exports for the optimization API so custom-pass
     authors can write `from lccfq_lang import Pass, PassManager, ...` without
-    reaching into `lccfq_lang.opt.*`.
+    reaching into `lccfq_lang.opt.*`. Re-exports are loaded lazily on first use.
 
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
-from .backend import QPU
-from .arch.register import QRegister, CRegister
-from .arch.context import Circuit, Test
-from .arch.isa import ISA
-from .arch.synth.qasm import QASMSynthesizer
+import importlib
 
-# Phase 5: optimization API surface ------------------------------------------
-from .opt.pass_base import Pass, PassContext, PassRecord
-from .opt.manager   import PassGroup, PassManager
-from .opt.cost      import Cost
-from .opt.op_view   import OpView
-from .opt.dag       import circuit_to_dag, dag_to_program
-from .opt.builtin.templates_arch import (
-    register_template,
-    unregister_template,
-    get_registered_templates,
-    TEMPLATE_REGISTRY,
-)
-from .opt.builtin.level_select import (
-    ALL_ARCH_PASSES,
-    ALL_MACH_PASSES,
-    passes_for_level,
-    mach_passes_for_level,
-    VALID_OPT_LEVELS,
-)
+# Public names resolved lazily on first access (PEP 562), so that importing the
+# package, or a single submodule through it, does not pull in the whole
+# backend and optimization stack (and networkx with it).
+_EXPORTS = {
+    "QPU": ".backend",
+    "QRegister": ".arch.register",
+    "CRegister": ".arch.register",
+    "Circuit": ".arch.context",
+    "Test": ".arch.context",
+    "ISA": ".arch.isa",
+    "QASMSynthesizer": ".arch.synth.qasm",
+    # Phase 5: optimization API surface --------------------------------------
+    "Pass": ".opt.pass_base",
+    "PassContext": ".opt.pass_base",
+    "PassRecord": ".opt.pass_base",
+    "PassGroup": ".opt.manager",
+    "PassManager": ".opt.manager",
+    "Cost": ".opt.cost",
+    "OpView": ".opt.op_view",
+    "circuit_to_dag": ".opt.dag",
+    "dag_to_program": ".opt.dag",
+    "register_template": ".opt.builtin.templates_arch",
+    "unregister_template": ".opt.builtin.templates_arch",
+    "get_registered_templates": ".opt.builtin.templates_arch",
+    "TEMPLATE_REGISTRY": ".opt.builtin.templates_arch",
+    "ALL_ARCH_PASSES": ".opt.builtin.level_select",
+    "ALL_MACH_PASSES": ".opt.builtin.level_select",
+    "passes_for_level": ".opt.builtin.level_select",
+    "mach_passes_for_level": ".opt.builtin.level_select",
+    "VALID_OPT_LEVELS": ".opt.builtin.level_select",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
 
 __all__ = [
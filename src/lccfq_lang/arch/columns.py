@@ -0,0 +1,102 @@
+"""
+Filename: columns.py
+Author: Santiago Nunez-Corrales
+Date: 2026-05-20
+Version: 1.0
+Description:
+    This file provides a columnar (struct-of-arrays) snapshot of an instruction
+    stream, meant for bulk numerical analysis of circuits without walking
+    Instruction objects one attribute at a time.
+
+License: Apache 2.0
+Contact: nunezco2@illinois.edu
+"""
+import numpy as np
+
+from dataclasses import dataclass
+from typing import Sequence
+from .instruction import Instruction
+
+
+@dataclass(frozen=True)
+class InstructionColumns:
+    """Parallel arrays describing a sequence of instructions. Row `i` of every
+    column corresponds to the `i`-th instruction. Ragged fields are padded to
+    the widest instruction: qubit columns with -1 and parameter columns with NaN.
+    """
+    symbols: np.ndarray
+    targets: np.ndarray
+    controls: np.ndarray
+    params: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_instructions(cls, instructions: Sequence[Instruction]) -> "InstructionColumns":
+        """Build the columnar snapshot of an instruction sequence.
+
+        :param instructions: instructions in program order
+        :return: columns for the given instructions
+        """
+        n = len(instructions)
+        symbols = np.array([i.symbol for i in instructions], dtype=str)
+
+        targets = cls.__pad([i.target_qubits for i in instructions], n, np.int32, -1)
+        controls = cls.__pad([i.control_qubits for i in instructions], n, np.int32, -1)
+        params = cls.__pad([i.params for i in instructions], n, np.float64, np.nan)
+
+        return cls(symbols=symbols, targets=targets, controls=controls, params=params)
+
+    @classmethod
+    def uniform(cls, symbol: str, targets, controls=None, params=None) -> "InstructionColumns":
+        """Build the columns for `n` applications of the same gate directly from
+        arrays, without creating one Instruction per application.
+
+        :param symbol: gate symbol shared by every row
+        :param targets: target qubits, shape (n,) or (n, k)
+        :param controls: control qubits, shape (n,) or (n, k), or None
+        :param params: parameters, shape (n,) or (n, k), or None
+        :return: columns with one row per application
+        """
+        targets = cls.__rows(targets, np.int32)
+        n = len(targets)
+        controls = np.full((n, 0), -1, dtype=np.int32) if controls is None else cls.__rows(controls, np.int32)
+        params = np.full((n, 0), np.nan) if params is None else cls.__rows(params, np.float64)
+
+        if len(controls) != n or len(params) != n:
+            raise ValueError(f"{symbol}: targets, controls and params must have the same number of rows")
+
+        symbols = np.full(n, symbol, dtype=f"<U{max(len(symbol), 1)}")
+
+        return cls(symbols=symbols, targets=targets, controls=controls, params=params)
+
+    @staticmethod
+    def __rows(values, dtype) -> np.ndarray:
+        """View per-row values as a 2D column block, one value per row when 1D.
+
+        :param values: array-like of shape (n,) or (n, k)
+        :param dtype: element type of the resulting array
+        :return: array of shape (n, k)
+        """
+        values = np.asarray(values, dtype=dtype)
+        return values.reshape(-1, 1) if values.ndim == 1 else values
+
+    @staticmethod
+    def __pad(rows, n: int, dtype, fill) -> np.ndarray:
+        """Pack ragged (possibly None) rows into a dense, padded 2D array.
+
+        :param rows: sequence of lists or None
+        :param n: number of rows
+        :param dtype: element type of the resulting array
+        :param fill: padding value
+        :return: array of shape (n, widest row)
+        """
+        width = max((len(r) for r in rows if r), default=0)
+        out = np.full((n, width), fill, dtype=dtype)
+
+        for k, r in enumerate(rows):
+            if r:
+                out[k, :len(r)] = r
+
+        return out
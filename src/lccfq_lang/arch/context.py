@@ -12,12 +12,33 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import copy
+import numpy as np
+
 from dataclasses import dataclass
+from functools import lru_cache
 from .instruction import Instruction
-from .register import QRegister, CRegister, QContext
+from .columns import InstructionColumns
+from .register import QRegister, CRegister, QContext, bitstrings
 from .error import UnknownCompilerPass
 from .protocol import Backend
-from typing import List, Dict, Callable, Tuple
+from typing import List, Dict, Callable, Iterable, Mapping, Tuple
+
+
+# Challenge contexts, bound once for the `>>` hot path
+_CIRCUIT = QContext.CIRCUIT
+_TEST = QContext.TEST
+
+
+@lru_cache(maxsize=None)
+def _unexecuted_result(bit_count: int) -> Dict[str, int]:
+    """Placeholder result for circuits that stop before execution: every
+    bitstring of the register mapped to -1. Built once per width.
+
+    :param bit_count: width of the classical register
+    :return: dictionary of bitstrings to -1, shared; absorb copies it
+    """
+    return dict.fromkeys(bitstrings(np.arange(1 << bit_count), bit_count), -1)
 
 
 @dataclass
@@ -103,6 +124,8 @@ class Circuit:
         self.shots = shots
         self.verbose = verbose
         self.instructions: List[Instruction] = list()
+        self._append = self.instructions.append
+        self._validate = True
         self._opt_records = []
         self._opt_groups_meta: dict[str, tuple] = {}
         self._opt_level = opt_level
@@ -110,12 +133,20 @@ class Circuit:
         self._report = report
         self.opt_report: dict | None = None
 
-    def results(self) -> Dict[str, int]:
+    def results(self) -> Mapping[str, int]:
         return self.creg.data
 
     def frequencies(self):
         return self.creg.frequencies()
 
+    def view(self) -> InstructionColumns:
+        """Columnar snapshot of the instructions added so far, for bulk analysis
+        over NumPy arrays instead of per-instruction attribute access.
+
+        :return: struct-of-arrays view of the circuit instructions
+        """
+        return InstructionColumns.from_instructions(self.instructions)
+
     def _handle_pass(self, program: list, cpass: str) -> None:
         """Handle compiler pass termination
 
@@ -131,7 +162,7 @@ class Circuit:
         if cpass == "executed":
             result = self.qpu.exec_circuit(program, self.shots)
         else:
-            result = {format(i, f"0{self.creg.bit_count}b"): -1 for i in range(2 ** self.creg.bit_count)}
+            result = _unexecuted_result(self.creg.bit_count)
 
         self.creg.absorb(result)
 
@@ -145,14 +176,53 @@ class Circuit:
 
         # We try to catch errors as early as they appear, which is
         # when these are included in the code.
-        challenged = self.qreg.challenge(instr, QContext.CIRCUIT)
-        self.instructions.append(challenged)
+        if self._validate:
+            instr = self.qreg.challenge(instr, _CIRCUIT)
+        else:
+            instr = copy.copy(instr)
+
+        self._append(instr)
+
+    def extend(self, instrs: Iterable[Instruction]) -> None:
+        """Add a batch of instructions to the circuit. Equivalent to applying `>>`
+        to each instruction in order, but resolves the challenge and append methods
+        once per batch instead of once per gate.
+
+        Fixed gate sequences (e.g., a Grover iteration) can be built once and pushed
+        repeatedly, since every instruction is added as a fresh copy.
+
+        :param instrs: instructions to add, in program order
+        :return: none
+        """
+        if not self._validate:
+            self.instructions.extend(map(copy.copy, instrs))
+            return
+
+        challenge = self.qreg.challenge
+        append = self._append
+
+        for instr in instrs:
+            append(challenge(instr, _CIRCUIT))
+
+    def __irshift__(self, instrs: Iterable[Instruction]):
+        """Add a batch of instructions using `>>=`, e.g.
+        `c >>= [isa.h(tg=0), isa.cx(ct=0, tg=1)]`. Delegates to `extend`.
+
+        :param instrs: instructions to add, in program order
+        :return: the circuit itself, so the augmented assignment keeps the binding
+        """
+        self.extend(instrs)
+        return self
 
     def __enter__(self):
-        """Enter the context
+        """Enter the context. A quiet parse-only run (`last_pass="parsed"` and not
+        verbose) is a dry run, so instructions are recorded as shallow copies without
+        being challenged against the register.
 
         :return: the circuit itself
         """
+        self._validate = (self.verbose or self.qpu is None
+                          or self.qpu.last_pass != "parsed")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -395,7 +465,7 @@ class Test:
 
         # We try to catch errors as early as they appear, which is
         # when these are included in the code.
-        challenged = self.qreg.challenge(instr, QContext.TEST)
+        challenged = self.qreg.challenge(instr, _TEST)
         self.instructions.append(challenged)
 
     def __enter__(self):
@@ -414,9 +484,9 @@ class Test:
         :param exc_tb: none
         :return: nothing
         """
-        for i, instruction in enumerate(self.instructions):
-            res = self.qpu.exec_single(instruction, instruction.shots)
-            self.accum[i] = res
+        instructions = self.instructions
+        results = self.qpu.exec_batch(instructions, [i.shots for i in instructions])
+        self.accum.update(enumerate(results))
 
 class Control:
     # TODO: control here means a change to the QPU state or its defining thresholds.
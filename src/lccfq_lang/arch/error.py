@@ -30,7 +30,7 @@ class NoMeasurementsAvailable(Exception):
     """
 
     def __init__(self):
-        self.message = f"No measurements available yet in the current classical register"
+        self.message = "No measurements available yet in the current classical register"
         super().__init__(self.message)
 
 
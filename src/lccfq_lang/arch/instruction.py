@@ -11,19 +11,70 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 
+import copy
+
 from abc import ABC, abstractmethod
-from enum import Enum
-from typing import Set, List
+from enum import IntEnum
+from typing import AbstractSet, List
 from .preconds import Precondition
 from .postconds import Postcondition
 
 
-class InstructionType(Enum):
+# Shared empty condition set. Most instructions never receive conditions, so
+# they all point here and a real set is only allocated on the first add.
+_NO_CONDITIONS: frozenset = frozenset()
+
+# Element types that need no copying inside qubit and parameter lists.
+_ATOMIC = frozenset((int, float, complex, bool, str))
+
+
+def _clone_field(value, memo: dict):
+    """Deep-copy an instruction field, short-circuiting the common case of a list
+    of plain numbers, which a slice copies exactly.
+
+    :param value: field value
+    :param memo: deepcopy memo
+    :return: independent copy of the field
+    """
+    if type(value) in _LISTS and all(type(v) in _ATOMIC for v in value):
+        return value[:]
+
+    return copy.deepcopy(value, memo)
+
+
+class _FrozenList(list):
+    """Qubit list of an interned instruction. It compares and indexes like a list,
+    but refuses in-place changes; copies are plain lists.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("qubit lists of interned instructions are read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+# List types whose atomic contents a slice copies into a plain list.
+_LISTS = (list, _FrozenList)
+
+
+class InstructionType(IntEnum):
     """InstructionType describes the main classes of instructions in LCCF code
     users will issue to a QPU.
 
     An instruction type being delayed means that its use will be determined by its
-    context.
+    context. Members are plain ints so type checks on the hot path are integer
+    comparisons.
     """
     DELAYED = 0
     CIRCUIT = 1
@@ -36,7 +87,27 @@ class Instruction:
     hardware connected to a QPU. Some instructions may not have a direct executable
     effect, but modulate the execution of other instructions. Instructions are
     delayed by default.
+
+    Circuits routinely hold thousands of instructions, so instances use slots
+    instead of a per-object attribute dictionary.
     """
+    __slots__ = (
+        "symbol",
+        "instruction_type",
+        "modifies_state",
+        "is_controlled",
+        "is_mapped",
+        "target_qubits",
+        "control_qubits",
+        "params",
+        "shots",
+        "pre",
+        "post",
+    )
+
+    # Class of copies of this instruction; None keeps the instruction's own class
+    _thawed = None
+
     def __init__(self,
                  symbol: str,
                  modifies_state: bool = True,
@@ -58,12 +129,106 @@ class Instruction:
         self.shots = shots
 
         # Pre- and post-conditions of the hoare triplet
-        self.pre: Set[Precondition] = set()
-        self.post: Set[Postcondition] = set()
+        self.pre: AbstractSet[Precondition] = _NO_CONDITIONS
+        self.post: AbstractSet[Postcondition] = _NO_CONDITIONS
 
     def __repr__(self):
         return f"{self.symbol} @ {self.target_qubits} ctrl by {self.control_qubits} w/ params={self.params}\n"
 
+    def __copy__(self) -> "Instruction":
+        """Shallow copy sharing every field with this instruction. Copies of interned
+        instructions get their own, mutable qubit lists.
+
+        :return: copy of this instruction
+        """
+        thawed = type(self)._thawed
+        new = Instruction.__new__(thawed or type(self))
+
+        for name in Instruction.__slots__:
+            setattr(new, name, getattr(self, name))
+
+        if thawed is not None:
+            if self.target_qubits is not None:
+                new.target_qubits = list(self.target_qubits)
+
+            if self.control_qubits is not None:
+                new.control_qubits = list(self.control_qubits)
+
+        return new
+
+    def thaw(self) -> "Instruction":
+        """Get an instruction that can be changed in place: this one, or a mutable
+        copy when it is interned (see `ISA`).
+
+        :return: mutable instruction
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Instruction":
+        """Deep copy without the generic reduce protocol, which dominates the cost of
+        challenging every instruction added to a circuit. Empty condition sets keep
+        pointing at the shared sentinel.
+
+        :param memo: deepcopy memo
+        :return: independent copy of this instruction
+        """
+        new = Instruction.__new__(type(self)._thawed or type(self))
+        memo[id(self)] = new
+
+        new.symbol = self.symbol
+        new.instruction_type = self.instruction_type
+        new.modifies_state = self.modifies_state
+        new.is_controlled = self.is_controlled
+        new.is_mapped = self.is_mapped
+        new.target_qubits = _clone_field(self.target_qubits, memo)
+        new.control_qubits = _clone_field(self.control_qubits, memo)
+        new.params = _clone_field(self.params, memo)
+        new.shots = self.shots
+        new.pre = self.pre if self.pre is _NO_CONDITIONS else copy.deepcopy(self.pre, memo)
+        new.post = self.post if self.post is _NO_CONDITIONS else copy.deepcopy(self.post, memo)
+
+        return new
+
+    def signature(self) -> tuple:
+        """Hashable description of what this instruction does, suitable as a key for
+        memoizing per-gate work (e.g., transpilation) across repeated gates. It is
+        computed on demand: instructions keep identity equality and hashing, since
+        passes rewrite their qubits and flags in place.
+
+        :return: tuple of symbol, target qubits, control qubits and parameters
+        """
+        return (self.symbol,
+                tuple(self.target_qubits or ()),
+                tuple(self.control_qubits or ()),
+                tuple(self.params or ()))
+
+    def with_qubits(self, target_qubits: List[int], control_qubits: List[int]) -> "Instruction":
+        """Rewrite this instruction onto other qubits, keeping its symbol, flags,
+        parameters, shots and conditions. Callers set the instruction type and
+        mapped flag of the result themselves.
+
+        :param target_qubits: target qubits of the rewritten instruction
+        :param control_qubits: control qubits of the rewritten instruction
+        :return: new, mutable instruction
+        """
+        # Positional: this runs once per instruction in mapping and routing
+        out = Instruction(self.symbol, self.modifies_state, self.is_controlled,
+                          target_qubits, control_qubits, self.params, self.shots)
+        out.inherit_conditions(self)
+
+        return out
+
+    def inherit_conditions(self, source: "Instruction") -> None:
+        """Take over the pre- and postconditions of the instruction this one was
+        derived from. Empty condition sets stay on the shared sentinel; only
+        non-empty ones are copied, so later additions do not leak between them.
+
+        :param source: instruction this one rewrites
+        :return: nothing
+        """
+        self.pre = set(source.pre) if source.pre else _NO_CONDITIONS
+        self.post = set(source.post) if source.post else _NO_CONDITIONS
+
     def add_precondition(self,
                          precondition: Precondition) -> None:
         """Add a callable precondition to this instruction.
@@ -71,6 +236,9 @@ class Instruction:
         :param precondition:
         :return: nothing
         """
+        if not isinstance(self.pre, set):
+            self.pre = set(self.pre)
+
         self.pre.add(precondition)
 
     def add_postcondition(self,
@@ -80,5 +248,49 @@ class Instruction:
         :param postcondition:
         :return:
         """
+        if not isinstance(self.post, set):
+            self.post = set(self.post)
+
         self.post.add(postcondition)
 
+
+class _InternedInstruction(Instruction):
+    """An instruction shared by every caller of an ISA gate method (see `freeze`).
+    Its fields, qubit lists and condition sets cannot be changed in place; copies
+    are ordinary, mutable instructions.
+    """
+    __slots__ = ()
+
+    _thawed = Instruction
+
+    def _read_only(self, *args, **kwargs):
+        raise AttributeError(f"interned instruction '{self.symbol}' is read-only; copy it first")
+
+    __setattr__ = __delattr__ = add_precondition = add_postcondition = _read_only
+
+    def thaw(self) -> Instruction:
+        return copy.copy(self)
+
+    def __reduce_ex__(self, protocol):
+        # Pickled as a mutable copy, like every other copy of an interned instruction
+        return copy.copy, (copy.copy(self),)
+
+
+def freeze(instruction: Instruction) -> Instruction:
+    """Make a freshly built instruction safe to share: its qubit lists become
+    read-only and further changes to its fields raise.
+
+    :param instruction: instruction nobody else references yet
+    :return: the same instruction, now read-only
+    """
+    if type(instruction) is _InternedInstruction:
+        return instruction
+
+    if instruction.target_qubits is not None:
+        instruction.target_qubits = _FrozenList(instruction.target_qubits)
+
+    if instruction.control_qubits is not None:
+        instruction.control_qubits = _FrozenList(instruction.control_qubits)
+
+    instruction.__class__ = _InternedInstruction
+    return instruction
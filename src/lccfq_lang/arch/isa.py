@@ -12,29 +12,75 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
-from typing import List
-from .instruction import Instruction, InstructionType
+import sys
+
+from typing import Callable, Dict, List, Tuple
+from .columns import InstructionColumns
+from .error import BadParameterCount, UnknownInstruction
+from .instruction import Instruction, InstructionType, freeze
+
+
+# Accepted parameter counts of parametric gates; any other gate takes a single
+# angle. cu accepts the OpenQASM global phase as an optional fourth parameter.
+_PARAM_ARITY: Dict[str, Tuple[int, ...]] = {
+    "u2": (2,),
+    "u3": (3,),
+    "cu": (3, 4),
+}
+
+
+def _arity(gate_name: str) -> Tuple[int, ...]:
+    """Parameter counts a parametric gate accepts.
+
+    :param gate_name: gate symbol
+    :return: accepted numbers of parameters
+    """
+    return _PARAM_ARITY.get(gate_name, (1,))
+
+
+def _check_params(params, arity: Tuple[int, ...]) -> None:
+    """Full parameter check behind the list fast path of parametric gates.
+    Parameters must be a list, the same rule `QRegister.challenge` applies.
+
+    :param params: parameters given to a parametric gate
+    :param arity: accepted numbers of parameters
+    :return: nothing
+    """
+    if not isinstance(params, list):
+        raise BadParameterCount(arity, f"{type(params).__name__} instead of a list")
+
+    if len(params) not in arity:
+        raise BadParameterCount(arity, len(params))
 
 
 def sq_nopar_gates(gate_names):
     """
-    Make single qubit non-parametric gate methods.
+    Make single qubit non-parametric gate methods. Instructions without shots
+    are interned per ISA instance (see `ISA`).
+
     :param gate_names: strings with single gate names
     :return: decorator for target class
     """
     def decorator(cls):
         for name in gate_names:
             def mk_sg_method(gate_name):
+                gate_name = sys.intern(gate_name)
+
                 def sg_method(self, tg: int = 0, shots=None) -> Instruction:
-                    return Instruction(
-                        symbol=gate_name,
-                        modifies_state=False,
-                        is_controlled=False,
-                        target_qubits=[tg],
-                        control_qubits=None,
-                        params=None,
-                        shots=shots
-                    )
+                    interned = shots is None and type(tg) is int
+
+                    if interned:
+                        inst = self._interned.get((gate_name, tg))
+
+                        if inst is not None:
+                            return inst
+
+                    inst = Instruction(gate_name, False, False, [tg], None, None, shots)
+
+                    if interned:
+                        self._interned[(gate_name, tg)] = freeze(inst)
+
+                    return inst
 
                 sg_method.__name__ = gate_name
                 return sg_method
@@ -47,7 +93,7 @@ def sq_nopar_gates(gate_names):
 def sq_par_gates(gate_names):
     """
     Make single qubit parametric gate methods. Note we are backward compatible with
-    OpenQASM 2 (`u2`, `u3)
+    OpenQASM 2 (`u2`, `u3). Parameter counts are checked against `_PARAM_ARITY`.
 
     :param gate_names: strings with single gate names
     :return: decorator for target class
@@ -55,16 +101,15 @@ def sq_par_gates(gate_names):
     def decorator(cls):
         for name in gate_names:
             def mk_sg_method(gate_name):
+                gate_name = sys.intern(gate_name)
+
+                arity = _arity(gate_name)
+
                 def sg_method(self, tg: int = 0, params=None, shots=None) -> Instruction:
-                    return Instruction(
-                        symbol=gate_name,
-                        modifies_state=False,
-                        is_controlled=False,
-                        target_qubits=[tg],
-                        control_qubits=None,
-                        params=params,
-                        shots=shots
-                    )
+                    if params is not None and (type(params) is not list or len(params) not in arity):
+                        _check_params(params, arity)
+
+                    return Instruction(gate_name, False, False, [tg], None, params, shots)
 
                 sg_method.__name__ = gate_name
                 return sg_method
@@ -76,7 +121,8 @@ def sq_par_gates(gate_names):
 
 def tqc_nopar_gates(gate_names):
     """
-    Make two-qubit controlled non-parametric gate methods.
+    Make two-qubit controlled non-parametric gate methods. Instructions without
+    shots are interned per ISA instance (see `ISA`).
 
     :param gate_names: strings with single gate names
     :return: decorator for target class
@@ -84,16 +130,23 @@ def tqc_nopar_gates(gate_names):
     def decorator(cls):
         for name in gate_names:
             def mk_sg_method(gate_name):
+                gate_name = sys.intern(gate_name)
+
                 def sg_method(self, ct: int = 1, tg: int = 0, shots=None) -> Instruction:
-                    return Instruction(
-                        symbol=gate_name,
-                        modifies_state=False,
-                        is_controlled=True,
-                        target_qubits=[tg],
-                        control_qubits=[ct],
-                        params=None,
-                        shots=shots
-                    )
+                    interned = shots is None and type(ct) is int and type(tg) is int
+
+                    if interned:
+                        inst = self._interned.get((gate_name, ct, tg))
+
+                        if inst is not None:
+                            return inst
+
+                    inst = Instruction(gate_name, False, True, [tg], [ct], None, shots)
+
+                    if interned:
+                        self._interned[(gate_name, ct, tg)] = freeze(inst)
+
+                    return inst
 
                 sg_method.__name__ = gate_name
                 return sg_method
@@ -105,7 +158,8 @@ def tqc_nopar_gates(gate_names):
 
 def tqc_par_gates(gate_names):
     """
-    Make two-qubit parametric gate methods.
+    Make two-qubit parametric gate methods. Parameter counts are checked against
+    `_PARAM_ARITY`.
 
     :param gate_names: strings with single gate names
     :return: decorator for target class
@@ -113,16 +167,15 @@ def tqc_par_gates(gate_names):
     def decorator(cls):
         for name in gate_names:
             def mk_sg_method(gate_name):
+                gate_name = sys.intern(gate_name)
+
+                arity = _arity(gate_name)
+
                 def sg_method(self, ct: int = 1, tg: int = 0, params=None, shots=None) -> Instruction:
-                    return Instruction(
-                        symbol=gate_name,
-                        modifies_state=False,
-                        is_controlled=True,
-                        target_qubits=[tg],
-                        control_qubits=[ct],
-                        params=params,
-                        shots=shots
-                    )
+                    if params is not None and (type(params) is not list or len(params) not in arity):
+                        _check_params(params, arity)
+
+                    return Instruction(gate_name, False, True, [tg], [ct], params, shots)
 
                 sg_method.__name__ = gate_name
                 return sg_method
@@ -142,17 +195,10 @@ def tests(gate_names):
     def decorator(cls):
         for name in gate_names:
             def mk_sg_method(gate_name):
-                def sg_method(self, tgs: List[int] = None, params=None, shots=None) -> Instruction:
-                    inst = Instruction(
-                        symbol=gate_name,
-                        modifies_state=False,
-                        is_controlled=False,
-                        target_qubits=tgs,
-                        control_qubits=None,
-                        params=params,
-                        shots=shots
-                    )
+                gate_name = sys.intern(gate_name)
 
+                def sg_method(self, tgs: List[int] = None, params=None, shots=None) -> Instruction:
+                    inst = Instruction(gate_name, False, False, tgs, None, params, shots)
                     inst.instruction_type = InstructionType.TEST
 
                     return inst
@@ -165,25 +211,97 @@ def tests(gate_names):
 
     return decorator
 
+def control_instrs(specs):
+    """
+    Make methods for instructions acting on a list of target qubits without
+    parameters (e.g., measure, reset, nop). They differ only in whether they
+    modify state and in the instruction type they are born with.
+
+    :param specs: map from symbol to (modifies_state, instruction_type)
+    :return: decorator for target class
+    """
+    def decorator(cls):
+        for name, (modifies_state, instruction_type) in specs.items():
+            def mk_ctl_method(symbol, modifies, itype):
+                symbol = sys.intern(symbol)
+
+                def ctl_method(self, tgs: List[int] = None) -> Instruction:
+                    inst = Instruction(symbol, modifies, False, tgs, None, None, None)
+                    inst.instruction_type = itype
+
+                    return inst
+
+                ctl_method.__name__ = symbol
+                return ctl_method
+
+            setattr(cls, name, mk_ctl_method(name, modifies_state, instruction_type))
+        return cls
+
+    return decorator
+
 @sq_nopar_gates([ "x", "y", "z", "h", "s", "sdg", "t", "tdg" ])
 @sq_par_gates(["p", "rx", "ry", "rz", "phase", "u2", "u3"])
 @tqc_nopar_gates(["cx", "cy", "cz", "ch"])
 @tqc_par_gates(["cp", "crx", "cry", "crz", "cphase", "cu"])
 @tests(["resfreq", "satspect", "powrab", "pispec", "resspect", "dispshift", "rocalib"])
+@control_instrs({
+    # NOPs are fungible and resets may be used outside of circuits: both stay
+    # delayed until their context is known. Measurements belong to circuits.
+    "nop": (False, InstructionType.DELAYED),
+    "measure": (True, InstructionType.CIRCUIT),
+    "reset": (True, InstructionType.DELAYED),
+})
 class ISA:
     """The Instruction Set Architecture comprises all possible operations that LCCF hardware
     will be able to make.
+
+    Non-parametric gates requested without shots are interned: asking twice for the
+    same gate on the same qubits yields the same Instruction object. Interned
+    instructions are read-only: changing them raises. Callers that annotate an
+    instruction in place must work on `instruction.thaw()`, a mutable copy.
     """
-    __circuit_instr = [
+    __circuit_instr = frozenset([
         "nop", "swap", "x", "y", "z", "h", "s", "sdg", "t", "tdg",
         "p", "rx", "ry", "rz", "phase", "u2", "u3",
         "cx", "cy", "cz", "ch",
         "cp", "crx", "cry", "crz", "cphase", "cu",
         "measure", "reset"
-    ]
+    ])
 
     def __init__(self, name: str):
         self.name = name
+        self._interned: Dict[tuple, Instruction] = {}
+        self._dispatch: Dict[str, Callable[..., Instruction]] = {
+            symbol: getattr(self, symbol) for symbol in self.__circuit_instr
+        }
+
+    def gate(self, symbol: str) -> Callable[..., Instruction]:
+        """Look up the bound method building a circuit instruction by its symbol,
+        for callers that pick the gate at runtime (e.g., rewriting passes).
+
+        :param symbol: circuit instruction symbol
+        :return: bound gate method
+        """
+        try:
+            return self._dispatch[symbol]
+        except KeyError:
+            raise UnknownInstruction(symbol)
+
+    def apply_many(self, symbol: str, targets, controls=None, params=None) -> InstructionColumns:
+        """Describe many applications of one circuit gate as columns instead of
+        Instruction objects, e.g. `isa.apply_many("h", np.arange(n))`. The result
+        feeds bulk analysis and mapping (see `QPUMapping.map_columns`).
+
+        :param symbol: circuit instruction symbol
+        :param targets: target qubits, shape (n,) or (n, k)
+        :param controls: control qubits, shape (n,) or (n, k), or None
+        :param params: parameters, shape (n,) or (n, k), or None
+        :return: columns with one row per application
+        """
+        if symbol not in self._dispatch:
+            raise UnknownInstruction(symbol)
+
+        return InstructionColumns.uniform(symbol, targets, controls, params)
 
     def swap(self, tg_a: int = 0, tg_b: int = 1, **kwargs) -> Instruction:
         """
@@ -202,79 +320,8 @@ class ISA:
         if "tg" in kwargs:
             tg_b = kwargs["tg"]
 
-        return Instruction(
-            symbol="swap",
-            modifies_state=False,
-            is_controlled=False,
-            target_qubits=[tg_b],
-            control_qubits=[tg_a],
-            params=None,
-            shots=None,
-        )
-
-    def nop(self, tgs=None) -> Instruction:
-        """The nop instruction is quite peculiar in the sense that it is fungible, and can be used for
-        various formal properties.
-
-        :param tg: target qubits
-        :return: an identity instruction
-        """
-        inst = Instruction(
-            symbol="nop",
-            modifies_state=False,
-            is_controlled=False,
-            target_qubits=tgs,
-            control_qubits=None,
-            params=None,
-            shots=None,
-        )
-
-        # We want NOPs available and fungible with a general type
-        inst.instruction_type = InstructionType.DELAYED
-        return inst
-
-    def measure(self, tgs: List[int]=None) -> Instruction:
-        """Measure one or multiple qubits. Note that
-        measurement modifies the state.
-
-        :param tgs: qubits to measure
-        :return: the measure instruction
-        """
-        inst = Instruction(
-            symbol="measure",
-            modifies_state=True,
-            is_controlled=False,
-            target_qubits=tgs,
-            control_qubits=None,
-            params=None,
-            shots=None,
-        )
-
-        inst.instruction_type = InstructionType.CIRCUIT
-        return inst
-
-    def reset(self, tgs=None) -> Instruction:
-        """Reset one or multiple qubits. Note that
-        measurement modifies the state.
-
-        Note: at the start,
-
-        :param tgs: qubits to reset
-        :return: the measure instruction
-        """
-        inst = Instruction(
-            symbol="reset",
-            modifies_state=True,
-            is_controlled=False,
-            target_qubits=tgs,
-            control_qubits=None,
-            params=None,
-            shots=None,
-        )
-
-        # Resets may be used outside of circuits, delay until tested
-        inst.instruction_type = InstructionType.DELAYED
-        return inst
+        # Routing emits one per inserted swap, so this stays off the keyword path.
+        return Instruction("swap", False, False, [tg_b], [tg_a], None, None)
 
     def ftol(self, threshold_fidelity) -> Instruction:
         """Change the fidelity tolerance of the QPU as interpreted by the
@@ -9,12 +9,18 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import numpy as np
+
+from dataclasses import replace
 from .instruction import Instruction, InstructionType
+from .columns import InstructionColumns
 from .isa import ISA
 from .error import NotEnoughQubits
 from ..mach.topology import QPUTopology
 from typing import List
 
+_DELAYED = InstructionType.DELAYED
+
 
 class QPUMapping:
     """
@@ -47,12 +53,12 @@ class QPUMapping:
         self.topology = topology
         self.routing_strategy = routing_strategy
 
-        if len(self.virtual_qubits) > len(self.topology.qubits()):
-            raise NotEnoughQubits(len(self.virtual_qubits), len(self.topology.qubits()))
+        physical = self.topology.qubits()
+
+        if len(self.virtual_qubits) > len(physical):
+            raise NotEnoughQubits(len(self.virtual_qubits), len(physical))
 
-        self.mapping = {
-            v: p for v, p in zip(self.virtual_qubits, self.topology.qubits())
-        }
+        self.mapping = dict(zip(self.virtual_qubits, physical))
 
     def with_layout(self, new_layout: dict) -> "QPUMapping":
         """Return a new QPUMapping with the supplied virtual->physical mapping.
@@ -100,28 +106,59 @@ class QPUMapping:
         mapped_controls = (
             [self.mapping[q] for q in instruction.control_qubits]
             if instruction.control_qubits
-            else []
+            else None
         )
 
-        mapped_instruction = Instruction(
-            symbol=instruction.symbol,
-            modifies_state=instruction.modifies_state,
-            is_controlled=instruction.is_controlled,
-            target_qubits=mapped_targets,
-            control_qubits=mapped_controls,
-            params=instruction.params,
-            shots=instruction.shots
-        )
+        mapped_instruction = instruction.with_qubits(mapped_targets, mapped_controls)
 
         # We may have a single test using a single gate with many shots
         # or a full circuit
-        mapped_instruction.instruction_type = InstructionType.DELAYED
-        mapped_instruction.pre = instruction.pre.copy()
-        mapped_instruction.post = instruction.post.copy()
+        mapped_instruction.instruction_type = _DELAYED
         mapped_instruction.is_mapped = True
 
         return mapped_instruction
 
+    def map_columns(self, columns: InstructionColumns) -> InstructionColumns:
+        """Map a columnar view of a program onto physical qubits in bulk. The
+        mapping is applied as a single lookup-table gather over the padded
+        target and control columns; padding (-1) is preserved.
+
+        :param columns: struct-of-arrays view over virtual qubits
+        :return: new view over physical qubits
+        :raises KeyError: if a qubit has no virtual-to-physical assignment
+        """
+        # Shift by one so the -1 padding indexes slot 0, which maps to itself
+        lut = np.full(max(self.mapping, default=-1) + 2, -1, dtype=np.int32)
+        lut[np.fromiter(self.mapping.keys(), dtype=np.int64) + 1] = list(self.mapping.values())
+
+        def gather(qubits: np.ndarray) -> np.ndarray:
+            if qubits.size:
+                # -1 pads rows with fewer qubits; anything below it would wrap in lut
+                if qubits.max() + 1 >= len(lut):
+                    raise KeyError(int(qubits.max()))
+
+                if qubits.min() < -1:
+                    raise KeyError(int(qubits.min()))
+
+            out = lut[qubits + 1]
+            unmapped = (out == -1) & (qubits != -1)
+
+            if unmapped.any():
+                raise KeyError(int(qubits[unmapped][0]))
+
+            return out
+
+        return replace(columns, targets=gather(columns.targets), controls=gather(columns.controls))
+
+    def needs_swap(self, instruction: Instruction) -> bool:
+        """Delegate deciding whether a mapped instruction must be routed to
+        the provided topology.
+
+        :param instruction: mapped instruction
+        :return: True if the instruction must go through `swaps`
+        """
+        return self.topology.needs_swap(instruction)
+
     def swaps(self, instruction: Instruction, isa: ISA) -> List[Instruction]:
         """Delegate introducing swaps to the provided topology provided
         instructions are already mapped to physical qubits.
@@ -10,15 +10,77 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 import copy
+import numpy as np
 
 from enum import Enum
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping
 from .error import NoMeasurementsAvailable, MalformedInstruction, NotAllowedInContext
 from .instruction import Instruction, InstructionType
 from .isa import ISA
 from .mapping import QPUMapping
 
 
+def bitstrings(indices: np.ndarray, width: int) -> List[str]:
+    """Format integer outcomes as fixed-width bitstrings (most significant bit
+    first) in one vectorized step: the bits are written as UCS-4 code points and
+    each row is reinterpreted as a string, avoiding a Python-level format call
+    per outcome.
+
+    :param indices: non-negative integer outcomes
+    :param width: number of bits per string
+    :return: bitstrings in the order of `indices`
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+
+    if width == 0:
+        return [format(int(i), "00b") for i in indices]
+
+    shifts = np.arange(width - 1, -1, -1)
+    digits = ((indices[:, None] >> shifts) & 1).astype(np.uint32) + ord("0")
+
+    return digits.view(f"U{width}").ravel().tolist()
+
+
+def bitstring_indices(keys: Iterable[str], width: int) -> np.ndarray:
+    """Parse fixed-width bitstrings (most significant bit first) back into their
+    integer outcomes, the inverse of `bitstrings`. The strings are read as UCS-4
+    code points in one array operation; keys of another width fall back to
+    `int(key, 2)` so they parse exactly as before.
+
+    :param keys: bitstrings to parse
+    :param width: expected number of bits per string
+    :return: integer outcome of each key, in order
+    """
+    keys = list(keys)
+    chars = np.array(keys, dtype=str)
+
+    if width == 0 or chars.size == 0 or chars.dtype.itemsize != 4 * width \
+            or np.char.str_len(chars).min() != width:
+        return np.array([int(k, 2) for k in keys], dtype=np.int64)
+
+    digits = chars.view(np.uint32).reshape(-1, width).astype(np.int64) - ord("0")
+
+    if ((digits >> 1) != 0).any():
+        return np.array([int(k, 2) for k in keys], dtype=np.int64)
+
+    return digits @ (1 << np.arange(width - 1, -1, -1, dtype=np.int64))
+
+
+def _are_qubits(qubits: list) -> bool:
+    """Check that every entry of a qubit list is a non-negative integer. A plain
+    loop: qubit lists hold one or two entries, too few to amortize a generator.
+
+    :param qubits: qubit indices
+    :return: True if all entries are valid qubit indices
+    """
+    for q in qubits:
+        if not isinstance(q, int) or q < 0:
+            return False
+
+    return True
+
+
 class QContext(Enum):
     """
     A context provides information about constraints that instructions must comply with.
@@ -30,6 +92,15 @@ class QContext(Enum):
     UNKNOWN = -1
 
 
+# Enum members bound once for the per-instruction challenge path
+_CIRCUIT = QContext.CIRCUIT
+_TEST = QContext.TEST
+_T_CIRCUIT = InstructionType.CIRCUIT
+_T_TEST = InstructionType.TEST
+_T_QPUSTATE = InstructionType.QPUSTATE
+_T_FORBIDDEN_IN_CIRCUIT = (_T_QPUSTATE, _T_TEST)
+
+
 class QRegister:
     """
     Class that manages the definition of a quantum register.
@@ -57,6 +128,15 @@ class QRegister:
         """
         return self.mapping.map(instruction)
 
+    def needs_swap(self, instruction: Instruction) -> bool:
+        """
+        Forward whether an instruction needs swaps from the mapping and its topology.
+
+        :param instruction: mapped instruction
+        :return: True if the instruction must go through `swaps`
+        """
+        return self.mapping.needs_swap(instruction)
+
     def swaps(self, instruction: Instruction, isa: ISA) -> List[Instruction]:
         """
         Forward adding swaps from the mapping and its topology.
@@ -104,16 +184,16 @@ class QRegister:
         instr = copy.deepcopy(instruction)
 
         # Case 1: no control or test instructions while executing a circuit
-        if context == QContext.CIRCUIT:
-            if instruction.instruction_type in [InstructionType.QPUSTATE, InstructionType.TEST]:
+        if context == _CIRCUIT:
+            if instruction.instruction_type in _T_FORBIDDEN_IN_CIRCUIT:
                 raise NotAllowedInContext(instruction, context)
 
             # We are in a circuit, remove shot data
-            instr.instruction_type = InstructionType.CIRCUIT
+            instr.instruction_type = _T_CIRCUIT
             instr.shots = None
         # Case 2: no QPU control instructions when executing a test block
-        elif context == QContext.TEST:
-            if instruction.instruction_type == InstructionType.QPUSTATE:
+        elif context == _TEST:
+            if instruction.instruction_type == _T_QPUSTATE:
                 raise NotAllowedInContext(instruction, context)
 
             if instruction.shots is None:
@@ -121,10 +201,10 @@ class QRegister:
 
             # Note that a gate, when interpreted as a test, will be executed and return a measurement
             # automatically
-            instr.instruction_type = InstructionType.TEST
+            instr.instruction_type = _T_TEST
         else:
             # We have a general QPU control instruction which will occur outside of a context
-            instr.instruction_type = InstructionType.QPUSTATE
+            instr.instruction_type = _T_QPUSTATE
 
         return instr
 
@@ -148,7 +228,9 @@ class QRegister:
         if minus is None:
             return self.mapping.virtual_qubits
         else:
-            return list(set(self.mapping.virtual_qubits) - set(minus))
+            # Filtering keeps register order, unlike a set difference
+            excluded = set(minus)
+            return [q for q in self.mapping.virtual_qubits if q not in excluded]
 
     @staticmethod
     def _is_well_formed_instruction(instruction: Instruction) -> bool:
@@ -160,32 +242,41 @@ class QRegister:
         if not isinstance(instruction.symbol, str) or not instruction.symbol:
             raise MalformedInstruction(instruction, "symbol must be a non-empty string")
 
-        if not isinstance(instruction.target_qubits, list) or not instruction.target_qubits:
-            if instruction.instruction_type != InstructionType.QPUSTATE:
+        targets = instruction.target_qubits
+
+        if not isinstance(targets, list) or not targets:
+            if instruction.instruction_type != _T_QPUSTATE:
                 raise MalformedInstruction(instruction, "target qubits must be a non-empty list")
 
-        if instruction.target_qubits is not None:
-            if not all(isinstance(q, int) and q >= 0 for q in instruction.target_qubits):
-                raise MalformedInstruction(instruction, "target qubits must be non-negative integers")
+        if targets is not None and not _are_qubits(targets):
+            raise MalformedInstruction(instruction, "target qubits must be non-negative integers")
 
         if instruction.is_controlled:
-            if not isinstance(instruction.control_qubits, list) or not instruction.control_qubits:
+            controls = instruction.control_qubits
+
+            if not isinstance(controls, list) or not controls:
                 raise MalformedInstruction(instruction, "control qubits must be present if controlled")
 
-            if not all(isinstance(q, int) and q >= 0 for q in instruction.control_qubits):
+            if not _are_qubits(controls):
                 raise MalformedInstruction(instruction, "control qubits must be non-negative integers")
 
-            if set(instruction.control_qubits).intersection(instruction.target_qubits):
+            if not set(controls).isdisjoint(targets):
                 raise MalformedInstruction(instruction, "target and control qubits must be different")
 
-        if instruction.params is not None:
-            if not isinstance(instruction.params, list):
+        params = instruction.params
+
+        if params is not None:
+            if not isinstance(params, list):
                 raise MalformedInstruction(instruction, "parameters must be a list of real values")
-            if not all(isinstance(p, float) for p in instruction.params):
-                raise MalformedInstruction(instruction, "all parameters must be real values")
 
-        if instruction.shots is not None:
-            if not isinstance(instruction.shots, int) or instruction.shots <= 0:
+            for p in params:
+                if not isinstance(p, float):
+                    raise MalformedInstruction(instruction, "all parameters must be real values")
+
+        shots = instruction.shots
+
+        if shots is not None:
+            if not isinstance(shots, int) or shots <= 0:
                 raise MalformedInstruction(instruction, "shot count must be positive integer")
 
         return True
@@ -198,10 +289,92 @@ class CRegister:
 
     def __init__(self, size: int):
         self.bit_count = size
-        self.data = None
+        self._data = None
+        self._counts = None
+
+    @property
+    def data(self) -> Mapping[str, int] | None:
+        """Measurement counts keyed by bitstring. When the register was filled
+        from packed outcomes, the dictionary is only built on first access. The
+        mapping is read-only, so it cannot drift from `counts_array`; assign or
+        `absorb` new counts instead.
+        """
+        if self._data is None:
+            if self._counts is None:
+                return None
+
+            nonzero = np.flatnonzero(self._counts)
+            self._data = dict(zip(
+                bitstrings(nonzero, self.bit_count),
+                self._counts[nonzero].tolist(),
+            ))
 
-    def absorb(self, data: Dict[str, int]):
-        self.data = data
+        return MappingProxyType(self._data)
+
+    @data.setter
+    def data(self, data: Dict[str, int] | None):
+        self.absorb(data)
+
+    def absorb(self, data: Dict[str, int] | None):
+        """Absorb measurement counts keyed by bitstring. The counts are copied,
+        so later changes to `data` do not reach the register.
+
+        :param data: bitstrings of at most bit_count bits mapped to their counts
+        :return: nothing
+        """
+        if data is not None:
+            if max(map(len, data), default=0) > self.bit_count:
+                raise ValueError(f"bitstrings must have at most {self.bit_count} bits")
+
+            data = dict(data)
+
+        self._data = data
+        self._counts = None
+
+    def absorb_shots(self, outcomes: np.ndarray):
+        """Absorb per-shot measurement outcomes packed as integers, where the
+        most significant bit corresponds to the leftmost bit of the bitstring.
+
+        :param outcomes: one packed outcome per shot
+        :return: nothing
+        """
+        size = 1 << self.bit_count
+        outcomes = np.asarray(outcomes)
+
+        if outcomes.size and (outcomes.min() < 0 or outcomes.max() >= size):
+            raise ValueError(f"outcomes must lie in [0, {size}) for {self.bit_count} bits")
+
+        self._counts = np.bincount(outcomes.astype(np.intp), minlength=size)
+        self._data = None
+
+    def absorb_counts(self, counts):
+        """Absorb a measurement histogram keyed by packed integer outcomes rather
+        than bitstrings, either as a dense array indexed by outcome or as a
+        mapping from outcome to count. No bitstring is built until `data` is read.
+
+        :param counts: array of length 2^bit_count, or Dict[int, int]
+        :return: nothing
+        """
+        size = 1 << self.bit_count
+
+        if isinstance(counts, dict):
+            dense = np.zeros(size, dtype=np.int64)
+
+            if counts:
+                outcomes = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+
+                if outcomes.min() < 0 or outcomes.max() >= size:
+                    raise ValueError(f"outcomes must lie in [0, {size}) for {self.bit_count} bits")
+
+                dense[outcomes] = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        else:
+            dense = np.asarray(counts, dtype=np.int64)
+
+            if dense.shape != (size,):
+                raise ValueError(f"expected {size} counts for {self.bit_count} bits, got shape {dense.shape}")
+
+        self._counts = dense
+        self._data = None
 
     def frequencies(self):
         if self.data is None:
@@ -213,3 +386,34 @@ class CRegister:
             return {k: 0.0 for k in self.data}
 
         return {k: v / total for k, v in self.data.items()}
+
+    def frequencies_array(self) -> np.ndarray:
+        """Relative frequencies as a dense array indexed by the integer value of
+        each bitstring. Computed in one vectorized division over `counts_array`,
+        without building the per-bitstring dictionary of `frequencies`.
+
+        :return: array of length 2^bit_count with the frequency of each outcome
+        """
+        counts = self.counts_array()
+        total = counts.sum()
+
+        if total == 0:
+            return np.zeros(len(counts), dtype=np.float64)
+
+        return counts / total
+
+    def counts_array(self) -> np.ndarray:
+        """Measurement counts as a dense array indexed by the integer value of
+        each bitstring, suited for vectorized post-processing.
+
+        :return: array of length 2^bit_count with the count of each outcome
+        """
+        if self._counts is None:
+            if self._data is None:
+                raise NoMeasurementsAvailable()
+
+            counts = np.zeros(1 << self.bit_count, dtype=np.int64)
+            counts[bitstring_indices(self._data.keys(), self.bit_count)] = list(self._data.values())
+            self._counts = counts
+
+        return self._counts
@@ -17,31 +17,43 @@ from ..context import Circuit
 from ..error import UnknownInstruction, MalformedInstruction
 
 
+# LCCFQ symbol to OpenQASM 3.0 gate name. Each synthesizer starts from its own
+# copy, so the table is built once per process rather than once per instance.
+_GATE_MAP: Dict[str, str] = {
+    # Single-qubit non-parametric
+    "x": "x", "y": "y", "z": "z", "h": "h",
+    "s": "s", "sdg": "sdg", "t": "t", "tdg": "tdg",
+
+    # Single-qubit parametric
+    "rx": "rx", "ry": "ry", "rz": "rz", "p": "p",
+    "phase": "phase", "u2": "u2", "u3": "u3",
+
+    # Two-qubit gates
+    "cx": "cx", "cy": "cy", "cz": "cz", "ch": "ch",
+    "cp": "cp", "crx": "crx", "cry": "cry",
+    "crz": "crz", "cphase": "cphase", "cu": "cu",
+    "swap": "swap",
+
+    # Meta
+    "measure": "measure",
+    "reset": "reset"
+}
+
+# Parameters are written with 10 significant digits. Gates take at most four
+# parameters, so each count gets a single prebuilt format call; longer lists
+# fall back to joining per-parameter formats.
+_PARAM_FORMAT = "{:.10g}".format
+_PARAM_FORMATS = tuple(", ".join(["{:.10g}"] * n).format for n in range(5))
+
+
 class QASMSynthesizer:
     """Handler for LCCFQ code to OpenQASM 3.0
 
     """
 
     def __init__(self):
-        self.gate_map: Dict[str, str] = {
-            # Single-qubit non-parametric
-            "x": "x", "y": "y", "z": "z", "h": "h",
-            "s": "s", "sdg": "sdg", "t": "t", "tdg": "tdg",
-
-            # Single-qubit parametric
-            "rx": "rx", "ry": "ry", "rz": "rz", "p": "p",
-            "phase": "phase", "u2": "u2", "u3": "u3",
-
-            # Two-qubit gates
-            "cx": "cx", "cy": "cy", "cz": "cz", "ch": "ch",
-            "cp": "cp", "crx": "crx", "cry": "cry",
-            "crz": "crz", "cphase": "cphase", "cu": "cu",
-            "swap": "swap",
-
-            # Meta
-            "measure": "measure",
-            "reset": "reset"
-        }
+        self.gate_map: Dict[str, str] = dict(_GATE_MAP)
+        self._qrefs: Dict[int, str] = {}
 
     def synth_circuit(self, circuit: Circuit, path: Optional[str] = None) -> str:
         """
@@ -55,22 +67,52 @@ class QASMSynthesizer:
             n_bits=circuit.creg.bit_count
         )
 
-        for instr in circuit.instructions:
-            qasm_line = self.synth_instruction(instr)
-            lines.append(qasm_line)
-
+        lines.extend(map(self.synth_instruction, circuit.instructions))
         qasm_code = "\n".join(lines)
 
         if path:
-            dirpath = os.path.dirname(path)
-
-            if dirpath:
-                os.makedirs(dirpath, exist_ok=True)
+            self._make_parent(path)
             with open(path, "w") as f:
                 f.write(qasm_code)
 
         return qasm_code
 
+    def synth_circuit_to_file(self, circuit: Circuit, path: str) -> None:
+        """
+        Write a full Circuit as an OpenQASM 3.0 program to a file, one line at a
+        time, without assembling the whole program as a single string first.
+        The file matches the one written by `synth_circuit`.
+
+        :param circuit: LCCFQ circuit object
+        :param path: destination file
+        :return: nothing
+        """
+        header = self.get_qasm_header(
+            n_qubits=circuit.qreg.qubit_count,
+            n_bits=circuit.creg.bit_count
+        )
+
+        self._make_parent(path)
+        with open(path, "w", buffering=1 << 20) as f:
+            write = f.write
+            write("\n".join(header))
+
+            for line in map(self.synth_instruction, circuit.instructions):
+                write("\n")
+                write(line)
+
+    @staticmethod
+    def _make_parent(path: str) -> None:
+        """Create the directory holding `path` if needed.
+
+        :param path: file path
+        :return: nothing
+        """
+        dirpath = os.path.dirname(path)
+
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+
     def synth_instruction(self, instr: Instruction) -> str:
         """
         Synthesize a single instruction into OpenQASM 3.0.
@@ -84,17 +126,8 @@ class QASMSynthesizer:
         if qasm_op is None:
             raise UnknownInstruction(instr)
 
-        tgs = [f"q[{q}]" for q in (instr.target_qubits or [])]
-        cts = [f"q[{c}]" for c in (instr.control_qubits or [])]
-
-        # OpenQASM 3.0: control(s) target(s)
-        qubit_args = cts + tgs
-
-        if instr.params:
-            param_str = ", ".join(f"{p:.10g}" for p in instr.params) #OpenQASM 3.0: numeric precision convention
-            gate_call = f"{qasm_op}({param_str})"
-        else:
-            gate_call = qasm_op
+        qref = self._qref
+        tgs = [qref(q) for q in instr.target_qubits] if instr.target_qubits else []
 
         # Measurement special case
         if symbol == "measure":
@@ -107,7 +140,36 @@ class QASMSynthesizer:
         if symbol == "reset":
             return "\n".join(f"reset {q};" for q in tgs)
 
-        return f"{gate_call} {' , '.join(qubit_args)};"
+        # OpenQASM 3.0: control(s) target(s)
+        if instr.control_qubits:
+            qubit_args = [qref(c) for c in instr.control_qubits]
+            qubit_args += tgs
+        else:
+            qubit_args = tgs
+
+        if instr.params:
+            params = instr.params
+            #OpenQASM 3.0: numeric precision convention
+            if len(params) < len(_PARAM_FORMATS):
+                param_str = _PARAM_FORMATS[len(params)](*params)
+            else:
+                param_str = ", ".join(map(_PARAM_FORMAT, params))
+            return f"{qasm_op}({param_str}) {' , '.join(qubit_args)};"
+
+        return f"{qasm_op} {' , '.join(qubit_args)};"
+
+    def _qref(self, q: int) -> str:
+        """QASM reference to qubit `q`, formatted once per qubit index.
+
+        :param q: qubit index
+        :return: QASM qubit reference
+        """
+        ref = self._qrefs.get(q)
+
+        if ref is None:
+            ref = self._qrefs[q] = f"q[{q}]"
+
+        return ref
 
     @staticmethod
     def get_qasm_header(n_qubits: int, n_bits: int) -> List[str]:
@@ -9,9 +9,11 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
-import toml
+import os
+import tomllib
 
 from enum import Enum
+from functools import lru_cache
 from typing import List, Dict
 from .defaults import Mach
 from .mach.ir import Gate, Control, Test
@@ -28,6 +30,39 @@ from .sys.base import QPUConfig
 from .sys.factories.mach import TranspilerFactory
 
 
+# Compilation stages a QPU can stop at
+PASS_NAMES = frozenset({
+    "parsed",
+    "mapped",
+    "swapped",
+    "expanded",
+    "arch_optimized",
+    "transpiled",
+    "mach_optimized",
+    "executed",
+})
+
+
+@lru_cache(maxsize=16)
+def _load_config(filename: str, mtime_ns: int, size: int) -> QPUConfig:
+    """Parse a QPU configuration file. Results are cached on the file's path,
+    modification time and size, so repeated QPU construction over an unchanged
+    file reuses the same (read-only) configuration object.
+
+    :param filename: path to the TOML configuration
+    :param mtime_ns: modification time of the file, part of the cache key
+    :param size: size of the file in bytes, part of the cache key
+    :return: parsed configuration
+    """
+    try:
+        with open(filename, "rb") as f:
+            data = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise BadQPUConfiguration("valid TOML", f"parse error in {filename}: {e}")
+
+    return QPUConfig(data)
+
+
 class QPUStatus(Enum):
     """Possible states the QPU can be in.
 
@@ -64,16 +99,7 @@ class QPU:
 
         # Set last compilation/transpilation that produces code
         # If last_pass is None or unrecognized, default to "transpiled"
-        if last_pass not in [
-            "parsed",
-            "mapped",
-            "swapped",
-            "expanded",
-            "arch_optimized",
-            "transpiled",
-            "mach_optimized",
-            "executed"
-        ]:
+        if last_pass not in PASS_NAMES:
             self.last_pass = last_pass if last_pass is not None else "transpiled"
 
         # Instantiate the LCCF Instruction Set Architecture
@@ -88,13 +114,11 @@ class QPU:
     @staticmethod
     def __from_file(filename: str) -> QPUConfig:
         try:
-            data = toml.load(filename)
+            st = os.stat(filename)
         except FileNotFoundError:
             raise BadQPUConfiguration("valid config file", f"file not found: {filename}")
-        except toml.TomlDecodeError as e:
-            raise BadQPUConfiguration("valid TOML", f"parse error in {filename}: {e}")
 
-        return QPUConfig(data)
+        return _load_config(os.fspath(filename), st.st_mtime_ns, st.st_size)
 
     def __bridge(self):
         """
@@ -135,6 +159,17 @@ class QPU:
         :return: Nothing"""
         pass
 
+    def exec_batch(self, instructions: List[Instruction], shots: List[int]) -> List:
+        """Execute a batch of independent instructions, one result per instruction.
+        Test contexts submit all of their instructions through a single call, so a
+        backend can amortize the round trip across the batch.
+
+        :param instructions: instructions to execute, in order
+        :param shots: number of shots for each instruction
+        :return: results in the order of the instructions
+        """
+        return [self.exec_single(instr, n) for instr, n in zip(instructions, shots)]
+
     def exec_circuit(self, circuit: List[Gate|Test|Control], shots: int) -> Dict[str, float]:
         """
         Execute the result of transpiling a circuit.
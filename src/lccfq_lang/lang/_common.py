@@ -1,5 +1,7 @@
 """Shared helpers for the lang.* family modules."""
 
+import numpy as np
+
 from typing import List
 
 from ..arch.instruction import Instruction
@@ -30,16 +32,44 @@ def _ucr(isa: ISA, gate_type, target, controls, angles) -> List[Instruction]:
     if not controls:
         return [gate_fn(tg=target, params=[angles[0]])]
 
-    half = len(angles) // 2
-    alpha = [(angles[j] + angles[j + half]) / 2.0 for j in range(half)]
-    beta = [(angles[j] - angles[j + half]) / 2.0 for j in range(half)]
+    # The recursion tree is evaluated one depth at a time: row r of `nodes`
+    # holds the angles of the r-th sub-multiplexor at that depth, whose
+    # children are rows 2r (alpha) and 2r+1 (beta) one level down. Only
+    # whether each node is negligible is kept, and the leaf angles.
+    k = len(controls)
+    nodes = np.asarray(angles, dtype=float).reshape(1, -1)
+    negligible = []
+
+    for _ in range(k):
+        negligible.append(np.all(np.abs(nodes) < 1e-15, axis=1).tolist())
+        half = nodes.shape[1] // 2
+        head, tail = nodes[:, :half], nodes[:, half:2 * half]
+        nodes = np.stack([(head + tail) / 2.0, (head - tail) / 2.0], axis=1).reshape(-1, half)
+
+    negligible.append(np.all(np.abs(nodes) < 1e-15, axis=1).tolist())
+    leaves = nodes[:, 0].tolist()
 
+    # Emit in the order of the recursion: UCR(α) · CX · UCR(β) · CX, where a
+    # node at depth d is controlled by controls[k - d - 1]. Negative depths
+    # mark pending CX gates on the work stack.
+    cx = isa.cx
     result = []
-    result.extend(_ucr(isa, gate_type, target, controls[:-1], alpha))
-    result.append(isa.cx(ct=controls[-1], tg=target))
-    result.extend(_ucr(isa, gate_type, target, controls[:-1], beta))
-    result.append(isa.cx(ct=controls[-1], tg=target))
+    stack = [(0, 0)]
 
-    return result
+    while stack:
+        depth, row = stack.pop()
 
+        if depth < 0:
+            result.append(cx(ct=row, tg=target))
+        elif negligible[depth][row]:
+            continue
+        elif depth == k:
+            result.append(gate_fn(tg=target, params=[leaves[row]]))
+        else:
+            ctrl = controls[k - depth - 1]
+            stack.append((-1, ctrl))
+            stack.append((depth + 1, 2 * row + 1))
+            stack.append((-1, ctrl))
+            stack.append((depth + 1, 2 * row))
 
+    return result
@@ -99,9 +99,12 @@ class BlockFactory:
 
         :raises KeyError: if b_type is not a recognized BlockType
         """
-        if b_type not in self.__dispatch:
+        # Single probe: Enum members hash through a Python-level __hash__
+        build = self.__dispatch.get(b_type)
+
+        if build is None:
             raise KeyError(
                 f"Unknown block type '{b_type}'. "
                 f"Available: {list(self.__dispatch.keys())}"
             )
-        return self.__dispatch[b_type](self.qreg.isa, target, **kwargs)
+        return build(self.qreg.isa, target, **kwargs)
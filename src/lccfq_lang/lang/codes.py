@@ -65,12 +65,11 @@ def syndrome(isa: ISA, target, **kwargs) -> List[Instruction]:
 
     active = _validate_stabilizer(stabilizer, n)
 
-    gate_for = {"X": "cx", "Y": "cy", "Z": "cz"}
+    gate_for = {"X": isa.cx, "Y": isa.cy, "Z": isa.cz}
 
     instructions = [isa.h(tg=ancilla)]
     for pos in sorted(active.keys()):
-        gate_fn = getattr(isa, gate_for[active[pos]])
-        instructions.append(gate_fn(ct=ancilla, tg=target[pos]))
+        instructions.append(gate_for[active[pos]](ct=ancilla, tg=target[pos]))
     instructions.append(isa.h(tg=ancilla))
 
     if measure:
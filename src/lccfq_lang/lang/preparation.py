@@ -18,6 +18,9 @@ from ..arch.instruction import Instruction
 from ..arch.isa import ISA
 from ._common import _ucr
 
+# Deletes the valid bitstring characters; anything left over is invalid
+_BITSTRING_CHARS = str.maketrans("", "", "01")
+
 
 def prepare_basis(isa: ISA, target, **kwargs) -> List[Instruction]:
     """Prepare a computational basis state in the Z, X, or Y basis.
@@ -39,12 +42,17 @@ def prepare_basis(isa: ISA, target, **kwargs) -> List[Instruction]:
     endianness = kwargs.get("endianness", "little")
     n = len(target)
 
+    if not isinstance(bitstring, str):
+        raise ValueError(
+            f"Bitstring must be a str of '0' and '1', got {type(bitstring).__name__}"
+        )
+
     if len(bitstring) != n:
         raise ValueError(
             f"Bitstring length {len(bitstring)} != target count {n}"
         )
 
-    if not all(b in ("0", "1") for b in bitstring):
+    if bitstring.translate(_BITSTRING_CHARS):
         raise ValueError(
             f"Bitstring must contain only '0' and '1', got '{bitstring}'"
         )
@@ -54,26 +62,19 @@ def prepare_basis(isa: ISA, target, **kwargs) -> List[Instruction]:
             f"Basis must be 'Z', 'X', or 'Y', got '{basis}'"
         )
 
-    bits = list(bitstring)
-
-    if endianness == "big":
-        bits = list(reversed(bits))
-
-    instructions = []
+    bits = bitstring[::-1] if endianness == "big" else bitstring
+    x, h, s = isa.x, isa.h, isa.s
 
     # Step 1: flip qubits where bit is '1'
-    for i, b in enumerate(bits):
-        if b == "1":
-            instructions.append(isa.x(tg=target[i]))
+    instructions = [x(tg=q) for q, b in zip(target, bits) if b == "1"]
 
     # Step 2: rotate into the requested basis
     if basis == "X":
-        for i in range(n):
-            instructions.append(isa.h(tg=target[i]))
+        instructions += [h(tg=q) for q in target]
     elif basis == "Y":
-        for i in range(n):
-            instructions.append(isa.h(tg=target[i]))
-            instructions.append(isa.s(tg=target[i]))
+        for q in target:
+            instructions.append(h(tg=q))
+            instructions.append(s(tg=q))
 
     return instructions
 
@@ -145,33 +146,27 @@ def prepare_state(isa: ISA, target, **kwargs) -> List[Instruction]:
 
     for k in reversed(range(n)):
         half = 1 << k
-        ry_angles = []
-        rz_angles = []
-
-        for c in range(half):
-            i0 = c
-            i1 = c + half
-            a0, a1 = omega[i0], omega[i1]
-            r0, r1 = abs(a0), abs(a1)
-            r = np.sqrt(r0 ** 2 + r1 ** 2)
-
-            theta = 2.0 * np.arctan2(r1, r0) if r > 1e-15 else 0.0
-            phi = (
-                np.angle(a1) - np.angle(a0)
-                if r0 > 1e-15 and r1 > 1e-15
-                else 0.0
-            )
-
-            ry_angles.append(theta)
-            rz_angles.append(phi)
+        # All 2^k pairs of a level are independent, so they are processed as
+        # whole slices: a0 holds entries with bit k = 0, a1 their partners.
+        a0 = omega[:half]
+        a1 = omega[half:2 * half]
+        r0, r1 = np.abs(a0), np.abs(a1)
+        r = np.sqrt(r0 ** 2 + r1 ** 2)
+        live = r > 1e-15
+
+        ry_angles = np.where(live, 2.0 * np.arctan2(r1, r0), 0.0)
+        rz_angles = np.where(
+            (r0 > 1e-15) & (r1 > 1e-15),
+            np.angle(a1) - np.angle(a0),
+            0.0,
+        )
 
-            # Update: disentangling maps (a0, a1) → (r·e^{i(α+beta)/2}, 0)
-            if r > 1e-15:
-                gamma = (np.angle(a0) + np.angle(a1)) / 2.0
-                omega[i0] = r * np.exp(1j * gamma)
-                omega[i1] = 0.0
+        # Update: disentangling maps (a0, a1) → (r·e^{i(α+beta)/2}, 0)
+        gamma = (np.angle(a0) + np.angle(a1)) / 2.0
+        omega[half:2 * half] = np.where(live, 0.0, a1)
+        omega[:half] = np.where(live, r * np.exp(1j * gamma), a0)
 
-        levels.append((k, ry_angles, rz_angles))
+        levels.append((k, ry_angles.tolist(), rz_angles.tolist()))
 
     # Phase 2: build the preparation circuit (reverse of disentangling).
     # Disentangling at level k applied  Ry(−theta) ∘ Rz(−phi);
@@ -9,13 +9,14 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
-from abc import ABC
 from typing import List, Optional
 
 
-class Command(ABC):
-    """Abstract definition of a command.
+class Command:
+    """Abstract definition of a command. Transpiled circuits hold one command per
+    native operation, so commands use slots instead of a per-object dictionary.
     """
+    __slots__ = ("symbol",)
 
     def __init__(self, symbol: str):
         self.symbol = symbol
@@ -26,6 +27,8 @@ class Gate(Command):
     Gates assume that the ordering of application in the circuit is the same as the
     diagram of that circuit.
     """
+    __slots__ = ("target_qubits", "control_qubits", "params", "tags", "duration")
+
     def __init__(self,
                  symbol: str,
                  target_qubits: List[int],
@@ -33,7 +36,9 @@ class Gate(Command):
                  params: List[float],
                  tags: Optional[dict] = None,
                  duration: Optional[float] = None):
-        super().__init__(symbol)
+        # Same as Command.__init__, assigned inline: transpilation builds one
+        # Gate per native operation
+        self.symbol = symbol
         self.target_qubits = target_qubits
         self.control_qubits = control_qubits
         self.params = params
@@ -69,6 +74,8 @@ class Control(Command):
     modulate their behavior.
 
     """
+    __slots__ = ("params",)
+
     def __init__(self,
                  symbol: str,
                  params: List[int]):
@@ -90,6 +97,8 @@ class Test(Command):
     """Define a test instruction. Tests can be parametric and require specifying the number of
     shots required to obtain meaningful statistics.
     """
+    __slots__ = ("params", "shots")
+
     def __init__(self,
                  symbol: str,
                  params: List[int],
@@ -9,10 +9,14 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import numpy as np
+
+from functools import lru_cache
 from numpy import pi as PI
 from typing import List, Callable, Optional, Union
 from ..ir import Gate, Control, Test
 from ..transpilers import Transpiler
+from ...arch.columns import InstructionColumns
 from ...arch.instruction import Instruction
 
 # Type alias for the params field in _table entries.  A plain list[float]
@@ -178,6 +182,54 @@ _CRY_SEQ = [("rx", [PI/2], "t")] + _CRZ_SEQ + [("rx", [-PI/2], "t")]
 _CP_SEQ  = list(_CRZ_SEQ) + _rz_c_lambda(+0.5)
 
 
+# Operand selectors per routing directive, as indices into the
+# (target_qubits, control_qubits, None) triple of the instruction being
+# transpiled: (index for the gate's targets, index for the gate's controls).
+_ROUTES = {
+    ".": (0, 2),
+    "t": (0, 2),
+    "c": (1, 2),
+    "*": (0, 1),
+    "+": (1, 0),
+}
+
+
+@lru_cache(maxsize=4096)
+def _derived_params(derive: Callable[[List[float]], List[float]], own: tuple) -> List[float]:
+    """Evaluate a derived-angle callable once per distinct parameter tuple. Circuits
+    repeat the same parametric gates heavily, and the resulting list is shared
+    read-only between gates, as literal table parameters already are.
+
+    :param derive: callable from the transpilation table
+    :param own: parameters of the instruction being transpiled
+    :return: derived parameter list
+    """
+    return list(derive(list(own)))
+
+
+def _compile_table(table: dict) -> dict:
+    """Resolve the routing directives of a transpilation table once, so each
+    transpiled instruction only has to index into its own operands.
+
+    :param table: transpilation table mapping symbols to (symbol, params, route)
+    :return: table mapping symbols to (symbol, params, target index, control index)
+    """
+    plans = {}
+
+    for name, seq in table.items():
+        plan = []
+
+        for symbol, params, route in seq:
+            if route not in _ROUTES:
+                raise ValueError(f"Unsupported routing directive: {route}")
+
+            plan.append((symbol, params, *_ROUTES[route]))
+
+        plans[name] = tuple(plan)
+
+    return plans
+
+
 class XYiSW(Transpiler):
     """Transpilation class for Pfaff Lab hardware.
     """
@@ -259,6 +311,8 @@ class XYiSW(Transpiler):
         ]
     }
 
+    _plans = _compile_table(_table)
+
     def __init__(self):
         """Add the main initialization table that will drive the transpilation process.
 
@@ -275,52 +329,92 @@ class XYiSW(Transpiler):
         :param instruction: The instruction to transpile.
         :return: A list of gates implementing that instruction.
         """
-        gate_maker = self._synthesize(instruction)
-        return list(map(lambda g: gate_maker(*g), self._table[instruction.symbol]))
+        operands = (instruction.target_qubits, instruction.control_qubits, None)
+        own = instruction.params
 
-    def transpile_test(self, instruction: Instruction) -> List[Test]:
-        pass
+        # Positional: (symbol, target_qubits, control_qubits, params)
+        return [
+            Gate(symbol, operands[tg], operands[ct],
+                 own if params is None else (_derived_params(params, tuple(own or ())) if callable(params) else params))
+            for symbol, params, tg, ct in self._plans[instruction.symbol]
+        ]
+
+    def transpile_columns(self, columns: InstructionColumns) -> InstructionColumns:
+        """Transpile a columnar instruction stream into the columns of its native
+        gates, in the same order `transpile_gate` would emit them. Every plan step
+        is written for all instructions sharing a symbol at once, so no Gate is
+        created; derived angles are evaluated once per distinct parameter row.
+
+        :param columns: struct-of-arrays view over mapped instructions
+        :return: columns with one row per native gate
+        """
+        if len(columns) == 0:
+            return InstructionColumns.from_instructions([])
+
+        groups = []
+        lengths = np.zeros(len(columns), dtype=np.int64)
+
+        for name in np.unique(columns.symbols).tolist():
+            rows = np.flatnonzero(columns.symbols == name)
+            plan = self._plans[name]
+            lengths[rows] = len(plan)
+            groups.append((rows, plan))
+
+        starts = np.cumsum(lengths) - lengths
+        total = int(lengths.sum())
+        operands = (columns.targets, columns.controls)
+        width = max(columns.targets.shape[1], columns.controls.shape[1])
+
+        symbols = np.empty(total, dtype=f"<U{max(len(step[0]) for _, plan in groups for step in plan)}")
+        targets = np.full((total, width), -1, dtype=np.int32)
+        controls = np.full((total, width), -1, dtype=np.int32)
+        params = []
+
+        for rows, plan in groups:
+            base = starts[rows]
+            own = columns.params[rows]
+
+            for k, (symbol, spec, tg, ct) in enumerate(plan):
+                at = base + k
+                symbols[at] = symbol
+                block = operands[tg][rows]
+                targets[at, :block.shape[1]] = block
+
+                if ct != 2:
+                    block = operands[ct][rows]
+                    controls[at, :block.shape[1]] = block
+
+                if spec is None:
+                    params.append((at, own))
+                elif callable(spec):
+                    params.append((at, self._derived_columns(spec, own)))
+                elif spec:
+                    params.append((at, np.tile(np.asarray(spec, dtype=np.float64), (len(rows), 1))))
+
+        out = np.full((total, max((p.shape[1] for _, p in params), default=0)), np.nan)
+
+        for at, values in params:
+            out[at, :values.shape[1]] = values
+
+        return InstructionColumns(symbols=symbols, targets=targets, controls=controls, params=out)
 
     @staticmethod
-    def _synthesize(instruction: Instruction) -> Callable[[str, "ParamSpec", str], Gate]:
-        """Synthesis method that produces a function which, with the right parameters, yields a gate.
+    def _derived_columns(derive: Callable[[List[float]], List[float]], own: np.ndarray) -> np.ndarray:
+        """Evaluate a derived-angle callable over a block of NaN-padded parameter
+        rows, once per distinct row.
 
-        :param instruction: instruction used to synthesize one gate in the corresponding sequence
-        :return: curried function that, upon parameters, completes the gates
+        :param derive: callable from the transpilation table
+        :param own: parameter rows of the instructions being transpiled
+        :return: derived parameters, one row per input row
         """
-        def gate(symbol: str, params: "ParamSpec" = None, route: str = ".") -> Gate:
-            if route in (".", "t"):
-                # We add . to distinguish single-qubit gates from two-qubit gates
-                tq = instruction.target_qubits
-                cq = None
-            elif route == "c":
-                tq = instruction.control_qubits
-                cq = None
-            elif route == "*":
-                tq = instruction.target_qubits
-                cq = instruction.control_qubits
-            elif route == "+":
-                tq = instruction.control_qubits
-                cq = instruction.target_qubits
-            else:
-                raise ValueError(f"Unsupported routing directive: {route}")
+        distinct, inverse = np.unique(own, axis=0, return_inverse=True)
+        derived = [_derived_params(derive, tuple(row[~np.isnan(row)].tolist())) for row in distinct]
+        values = np.full((len(derived), max(map(len, derived), default=0)), np.nan)
+
+        for k, row in enumerate(derived):
+            values[k, :len(row)] = row
+
+        return values[inverse.reshape(-1)]
 
-            # Resolve the params field.
-            # - callable: compute derived angles from instruction.params
-            # - None:     substitute the instruction's own params verbatim
-            # - list:     use verbatim (existing behaviour)
-            if callable(params):
-                resolved_params = list(params(instruction.params or []))
-            elif params is None:
-                resolved_params = instruction.params
-            else:
-                resolved_params = params
-
-            return Gate(
-                symbol=symbol,
-                target_qubits=tq,
-                control_qubits=cq,
-                params=resolved_params,
-            )
-
-        return gate
+    def transpile_test(self, instruction: Instruction) -> List[Test]:
+        pass
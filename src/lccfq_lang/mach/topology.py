@@ -57,6 +57,8 @@ class QPUTopology:
         if not self.__test(self.topo_type):
             raise BadTopologyType(self.topo_type)
 
+        self.__paths = None
+
     def qubits(self) -> List[int]:
         """List of available device qubit indices
 
@@ -64,6 +66,23 @@ class QPUTopology:
         """
         return list(self.internal.nodes.keys())
 
+    def shortest_path(self, q0: int, q1: int) -> List[int]:
+        """Shortest path between two device qubits. All-pairs paths are computed
+        once on first use, since the coupling graph does not change after
+        construction.
+
+        :param q0: source qubit
+        :param q1: destination qubit
+        :return: qubits along the path, endpoints included
+        """
+        if self.__paths is None:
+            self.__paths = dict(nx.all_pairs_shortest_path(self.internal))
+
+        try:
+            return self.__paths[q0][q1]
+        except KeyError:
+            raise QubitsNotConnected(q0, q1)
+
     #####################################
     # Tests for different network types #
     #####################################
@@ -105,10 +124,10 @@ class QPUTopology:
             # assuming an ordering of qubits numbered from the readout resonator
             # outwards
             if not config.exclusions:
-                virtual_qubits = config.qubits
+                virtual_qubits = list(config.qubits)
             else:
                 min_exclusion = min(config.exclusions)
-                virtual_qubits = list(filter((lambda q: q < min_exclusion), config.qubits))
+                virtual_qubits = [q for q in config.qubits if q < min_exclusion]
 
         else:
             # For the moment, do a set difference
@@ -124,11 +143,35 @@ class QPUTopology:
         :return: filtered connections
         """
         if not config.exclusions:
-            return config.couplings  # nothing to exclude
+            return list(config.couplings)  # nothing to exclude
 
         min_excluded = min(config.exclusions)
         return [c for c in config.couplings if min_excluded not in c]
 
+    def needs_swap(self, instruction: Instruction) -> bool:
+        """Determine whether `swaps` would do anything other than return the
+        instruction unchanged, so bulk routing can skip the common case.
+        Malformed instructions report True to let `swaps` raise for them.
+
+        :param instruction: mapped instruction
+        :return: True if the instruction must go through `swaps`
+        """
+        if instruction.symbol == "measure" or instruction.symbol == "reset":
+            return False
+
+        targets = instruction.target_qubits or ()
+        controls = instruction.control_qubits or ()
+        count = len(controls) + len(targets)
+
+        if count == 1:
+            return False
+
+        if count != 2:
+            return True
+
+        q0, q1 = (*controls, *targets)
+        return not self.internal.has_edge(q0, q1)
+
     def swaps(self, instruction: Instruction, isa: ISA) -> List[Instruction]:
         """
         Map an instruction from topology-independent qubits to the specifics of a device
@@ -154,31 +197,36 @@ class QPUTopology:
         if self.internal.has_edge(q0, q1):
             return [instruction]
 
-        try:
-            path = nx.shortest_path(self.internal, source=q0, target=q1)
-        except nx.NetworkXNoPath:
-            raise QubitsNotConnected(q0, q1)
+        path = self.shortest_path(q0, q1)
 
         pre_swaps = []
         post_swaps = []
 
         for i in range(len(path) - 2):
-            pre_swaps.append(isa.swap(tg_a=path[i], tg_b=path[i + 1]))
+            pre_swaps.append(self.__physical_swap(isa, path[i], path[i + 1]))
 
         routed_q0 = path[-2]
         routed_q1 = path[-1]
 
-        routed_instr = Instruction(
-            symbol=instruction.symbol,
-            modifies_state=instruction.modifies_state,
-            is_controlled=instruction.is_controlled,
-            target_qubits=[routed_q1 if q1 in targets else routed_q0],
-            control_qubits=[routed_q0 if q0 in controls else routed_q1],
-            params=instruction.params,
-            shots=instruction.shots
-        )
+        routed_instr = instruction.with_qubits([routed_q1 if q1 in targets else routed_q0],
+                                               [routed_q0 if q0 in controls else routed_q1])
+        routed_instr.instruction_type = instruction.instruction_type
+        routed_instr.is_mapped = instruction.is_mapped
 
         for i in reversed(range(len(path) - 2)):
-            post_swaps.append(isa.swap(tg_a=path[i], tg_b=path[i + 1]))
+            post_swaps.append(self.__physical_swap(isa, path[i], path[i + 1]))
 
         return pre_swaps + [routed_instr] + post_swaps
+
+    @staticmethod
+    def __physical_swap(isa: ISA, a: int, b: int) -> Instruction:
+        """Inserted swaps act on physical qubits, so they are already mapped.
+
+        :param isa: instruction set architecture for swaps
+        :param a: first physical qubit
+        :param b: second physical qubit
+        :return: swap instruction marked as mapped
+        """
+        swap = isa.swap(tg_a=a, tg_b=b)
+        swap.is_mapped = True
+        return swap
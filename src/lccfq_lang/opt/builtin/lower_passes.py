@@ -12,12 +12,11 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 from __future__ import annotations
-from itertools import chain
 from typing import List
 from lccfq_lang.arch.instruction import Instruction
 from lccfq_lang.arch.register import QRegister
 from lccfq_lang.arch.isa import ISA
-from lccfq_lang.arch.error import UnknownCompilerPass
+from lccfq_lang.arch.error import MalformedInstruction, UnknownCompilerPass
 from lccfq_lang.mach.transpilers import Transpiler
 from lccfq_lang.opt.pass_base import Pass, PassContext
 from lccfq_lang.opt.manager import PassGroup
@@ -34,6 +33,23 @@ LOWERING_STAGES: tuple[str, ...] = (
 )
 
 
+# Stage -> group name. arch_optimized and mach_optimized are conditional and
+# fall back to the preceding lowering group when that group is omitted.
+STAGE_TO_GROUP: dict[str, str] = {
+    "mapped":          "lower_map",
+    "swapped":         "lower_swap",
+    "expanded":        "lower_expand",
+    "arch_optimized":  "arch_opt",
+    "transpiled":      "lower_transpile",
+    "mach_optimized":  "mach_opt",
+}
+
+STAGE_FALLBACK: dict[str, str] = {
+    "arch_optimized":  "lower_expand",
+    "mach_optimized":  "lower_transpile",
+}
+
+
 class MappedPass(Pass):
     """Maps virtual qubits to physical qubits."""
 
@@ -44,7 +60,10 @@ class MappedPass(Pass):
         self._qreg = qreg
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        return list(map(self._qreg.map, program)), True
+        # Bound once per run, skipping the QRegister forwarder on every instruction
+        qmap = self._qreg.mapping.map
+
+        return [qmap(instr) for instr in program], True
 
 
 class SwappedPass(Pass):
@@ -58,9 +77,26 @@ class SwappedPass(Pass):
         self._isa = isa
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        return list(chain.from_iterable(
-            map(lambda instr: self._qreg.swaps(instr, self._isa), program)
-        )), True
+        # Most instructions are 1q or already adjacent; only those that need
+        # routing go through swaps(), the rest are forwarded as they are.
+        needs_swap = self._qreg.needs_swap
+        swaps = self._qreg.swaps
+        isa = self._isa
+        out: List[Instruction] = []
+        append = out.append
+
+        for instr in program:
+            # Routing operates on physical qubits: its input is the mapped
+            # stream produced by lower_map, never the virtual program.
+            if not instr.is_mapped:
+                raise MalformedInstruction(instr, "SwappedPass expects mapped instructions")
+
+            if needs_swap(instr):
+                out += swaps(instr, isa)
+            else:
+                append(instr)
+
+        return out, True
 
 
 class TranspiledPass(Pass):
@@ -79,9 +115,9 @@ class TranspiledPass(Pass):
         self._transpiler = transpiler
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        return list(chain.from_iterable(
-            map(self._transpiler.transpile_gate, program)
-        )), True
+        transpile_gate = self._transpiler.transpile_gate
+
+        return [g for instr in program for g in transpile_gate(instr)], True
 
 
 def build_lowering_groups(
@@ -210,30 +246,20 @@ def slice_groups_for(last_pass: str, groups: list[PassGroup]) -> list[PassGroup]
         return []
     if last_pass == "executed":
         return groups
-    if last_pass not in LOWERING_STAGES:
-        raise UnknownCompilerPass(last_pass)
-
-    # Stage -> group name. arch_optimized and mach_optimized are conditional.
-    STAGE_TO_GROUP = {
-        "mapped":          "lower_map",
-        "swapped":         "lower_swap",
-        "expanded":        "lower_expand",
-        "arch_optimized":  "arch_opt",
-        "transpiled":      "lower_transpile",
-        "mach_optimized":  "mach_opt",
-    }
-    target_group = STAGE_TO_GROUP[last_pass]
+
+    try:
+        target_group = STAGE_TO_GROUP[last_pass]
+    except KeyError:
+        raise UnknownCompilerPass(last_pass) from None
 
     # If the requested group is missing (arch_opt or mach_opt was omitted),
     # fall back to the immediately preceding lowering stage that *is* present.
     group_names = [g.name for g in groups]
     if target_group not in group_names:
-        if last_pass == "arch_optimized":
-            target_group = "lower_expand"
-        elif last_pass == "mach_optimized":
-            target_group = "lower_transpile"
-        else:
-            raise UnknownCompilerPass(last_pass)
+        try:
+            target_group = STAGE_FALLBACK[last_pass]
+        except KeyError:
+            raise UnknownCompilerPass(last_pass) from None
 
     idx = group_names.index(target_group)
     return groups[: idx + 1]
@@ -12,16 +12,81 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 from __future__ import annotations
-from typing import List
+from itertools import islice
+from typing import Callable, List
 import numpy as np
 
-from lccfq_lang.arch.instruction import Instruction
+from lccfq_lang.arch.instruction import Instruction, freeze
 from lccfq_lang.arch.isa import ISA
 from lccfq_lang.opt.pass_base import Pass, PassContext
 
 
 LOWER_EXPAND_PASS_NAMES = ("lower_u2", "lower_u3", "lower_cu", "fanout_measure")
 
+# Bound on the number of distinct (qubits, params) decompositions each lowering
+# pass remembers before starting over.
+_MEMO_SIZE = 4096
+
+_HALF_PI = np.pi / 2
+
+
+def _flat_lower(
+    program: List[Instruction],
+    needs: Callable[[Instruction], bool],
+    lower: Callable[[Instruction], List[Instruction]],
+):
+    """Replace every instruction matching `needs` by `lower(instr)` in a single
+    traversal. The untouched prefix before the first match is copied with one
+    slice, so a program with nothing to lower costs a single list copy rather
+    than one append per instruction.
+
+    :param program: input program, not mutated
+    :param needs: predicate selecting instructions to lower
+    :param lower: expansion of a selected instruction
+    :return: (new program, changed)
+    """
+    first = next((k for k, instr in enumerate(program) if needs(instr)), None)
+
+    if first is None:
+        return program[:], False
+
+    out = program[:first]
+    append = out.append
+    extend = out.extend
+
+    for instr in islice(program, first, None):
+        if needs(instr):
+            extend(lower(instr))
+        else:
+            append(instr)
+
+    return out, True
+
+
+def _memo_lower(memo: dict, build: Callable[..., List[Instruction]], *key) -> List[Instruction]:
+    """Decomposition of an instruction, built once per distinct qubits and
+    parameters and then reused. Lowered instructions are shared between
+    occurrences, so they are frozen like interned ISA gates. Keys with
+    unhashable parameters are built every time.
+
+    :param memo: per-pass memo of decompositions
+    :param build: builds the decomposition from the key fields on a miss
+    :param key: qubits and parameters of the instruction being lowered
+    :return: lowered instructions
+    """
+    try:
+        cached = memo.get(key)
+    except TypeError:
+        return build(*key)
+
+    if cached is None:
+        if len(memo) >= _MEMO_SIZE:
+            memo.clear()
+
+        cached = memo[key] = [freeze(instr) for instr in build(*key)]
+
+    return cached
+
 
 class LowerU2(Pass):
     """Decomposes u2(phi, lambda) into [rz(phi), ry(pi/2), rz(lambda)]."""
@@ -31,22 +96,22 @@ class LowerU2(Pass):
 
     def __init__(self, isa: ISA) -> None:
         self._isa = isa
+        self._memo: dict = {}
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        out: List[Instruction] = []
-        changed = False
-        for instr in program:
-            if instr.symbol == "u2":
-                phi = instr.params[0]
-                lbmd = instr.params[1]
-                tg = instr.target_qubits[0]
-                out.append(self._isa.rz(tg=tg, params=[phi]))
-                out.append(self._isa.ry(tg=tg, params=[np.pi / 2]))
-                out.append(self._isa.rz(tg=tg, params=[lbmd]))
-                changed = True
-            else:
-                out.append(instr)
-        return out, changed
+        return _flat_lower(program, lambda instr: instr.symbol == "u2", self._lower)
+
+    def _lower(self, instr: Instruction) -> List[Instruction]:
+        tg = instr.target_qubits[0]
+        phi, lbmd = instr.params[:2]
+        return _memo_lower(self._memo, self._build, tg, phi, lbmd)
+
+    def _build(self, tg: int, phi, lbmd) -> List[Instruction]:
+        return [
+            self._isa.rz(tg=tg, params=[phi]),
+            self._isa.ry(tg=tg, params=[_HALF_PI]),
+            self._isa.rz(tg=tg, params=[lbmd]),
+        ]
 
 
 class LowerU3(Pass):
@@ -57,23 +122,22 @@ class LowerU3(Pass):
 
     def __init__(self, isa: ISA) -> None:
         self._isa = isa
+        self._memo: dict = {}
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        out: List[Instruction] = []
-        changed = False
-        for instr in program:
-            if instr.symbol == "u3":
-                phi = instr.params[0]
-                theta = instr.params[1]
-                lbmd = instr.params[2]
-                tg = instr.target_qubits[0]
-                out.append(self._isa.rz(tg=tg, params=[phi]))
-                out.append(self._isa.ry(tg=tg, params=[theta]))
-                out.append(self._isa.rz(tg=tg, params=[lbmd]))
-                changed = True
-            else:
-                out.append(instr)
-        return out, changed
+        return _flat_lower(program, lambda instr: instr.symbol == "u3", self._lower)
+
+    def _lower(self, instr: Instruction) -> List[Instruction]:
+        tg = instr.target_qubits[0]
+        phi, theta, lbmd = instr.params[:3]
+        return _memo_lower(self._memo, self._build, tg, phi, theta, lbmd)
+
+    def _build(self, tg: int, phi, theta, lbmd) -> List[Instruction]:
+        return [
+            self._isa.rz(tg=tg, params=[phi]),
+            self._isa.ry(tg=tg, params=[theta]),
+            self._isa.rz(tg=tg, params=[lbmd]),
+        ]
 
 
 class LowerCU(Pass):
@@ -87,28 +151,28 @@ class LowerCU(Pass):
 
     def __init__(self, isa: ISA) -> None:
         self._isa = isa
+        self._memo: dict = {}
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        out: List[Instruction] = []
-        changed = False
-        for instr in program:
-            if instr.symbol == "cu":
-                phi = instr.params[0]
-                theta = instr.params[1]
-                lbmd = instr.params[2]
-                ct = instr.control_qubits[0]
-                tg = instr.target_qubits[0]
-                out.append(self._isa.rz(tg=tg, params=[lbmd]))
-                out.append(self._isa.ry(tg=tg, params=[theta / 2]))
-                out.append(self._isa.cx(ct=ct, tg=tg))
-                out.append(self._isa.ry(tg=tg, params=[-theta / 2]))
-                out.append(self._isa.rz(tg=tg, params=[-(phi + lbmd)]))
-                out.append(self._isa.cx(ct=ct, tg=tg))
-                out.append(self._isa.rz(tg=tg, params=[phi]))
-                changed = True
-            else:
-                out.append(instr)
-        return out, changed
+        return _flat_lower(program, lambda instr: instr.symbol == "cu", self._lower)
+
+    def _lower(self, instr: Instruction) -> List[Instruction]:
+        ct = instr.control_qubits[0]
+        tg = instr.target_qubits[0]
+        # cu may carry an optional fourth (global phase) parameter, ignored here.
+        phi, theta, lbmd = instr.params[:3]
+        return _memo_lower(self._memo, self._build, ct, tg, phi, theta, lbmd)
+
+    def _build(self, ct: int, tg: int, phi, theta, lbmd) -> List[Instruction]:
+        return [
+            self._isa.rz(tg=tg, params=[lbmd]),
+            self._isa.ry(tg=tg, params=[theta / 2]),
+            self._isa.cx(ct=ct, tg=tg),
+            self._isa.ry(tg=tg, params=[-theta / 2]),
+            self._isa.rz(tg=tg, params=[-(phi + lbmd)]),
+            self._isa.cx(ct=ct, tg=tg),
+            self._isa.rz(tg=tg, params=[phi]),
+        ]
 
 
 class FanoutMeasure(Pass):
@@ -122,15 +186,27 @@ class FanoutMeasure(Pass):
 
     def __init__(self, isa: ISA) -> None:
         self._isa = isa
+        # Single-target measures by qubit, frozen and shared like the memoized
+        # decompositions
+        self._single: dict = {}
 
     def run(self, program: List[Instruction], ctx: PassContext):
-        out: List[Instruction] = []
-        changed = False
-        for instr in program:
-            if instr.symbol == "measure" and len(instr.target_qubits) > 1:
-                for q in instr.target_qubits:
-                    out.append(self._isa.measure(tgs=[q]))
-                changed = True
-            else:
-                out.append(instr)
-        return out, changed
+        return _flat_lower(
+            program,
+            lambda instr: instr.symbol == "measure" and len(instr.target_qubits) > 1,
+            self._lower,
+        )
+
+    def _lower(self, instr: Instruction) -> List[Instruction]:
+        single = self._single
+        out = []
+
+        for q in instr.target_qubits:
+            measure = single.get(q)
+
+            if measure is None:
+                measure = single[q] = freeze(self._isa.measure(tgs=[q]))
+
+            out.append(measure)
+
+        return out
@@ -226,8 +226,7 @@ class MergeRotations(Pass):
         return [node.op for node in survivors if node.alive], changed
 
     def _build_rotation(self, sym: str, q: int, angle: float) -> Instruction:
-        method = getattr(self._isa, sym)
-        return method(tg=q, params=[angle])
+        return self._isa.gate(sym)(tg=q, params=[angle])
 
 
 # ---------------------------------------------------------------------------
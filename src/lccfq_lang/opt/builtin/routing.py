@@ -13,6 +13,7 @@ Contact: nunezco2@illinois.edu
 from __future__ import annotations
 import math
 import weakref
+from bisect import bisect_right
 from itertools import combinations
 from typing import List, Optional
 import networkx as nx
@@ -23,6 +24,8 @@ from lccfq_lang.arch.register import QRegister
 from lccfq_lang.mach.topology import QPUTopology
 from lccfq_lang.opt.pass_base import Pass, PassContext
 
+_DELAYED = InstructionType.DELAYED
+
 
 # ---------------------------------------------------------------------------
 # Tunable constants (§4.2)
@@ -54,12 +57,11 @@ def _two_qubit_qubits(instr: Instruction) -> Optional[tuple]:
     """
     if instr.symbol in ("measure", "reset"):
         return None
-    targets = instr.target_qubits or []
-    controls = instr.control_qubits or []
-    qs = list(controls) + list(targets)
-    if len(qs) != 2:
+    targets = instr.target_qubits or ()
+    controls = instr.control_qubits or ()
+    if len(controls) + len(targets) != 2:
         return None
-    return (qs[0], qs[1])
+    return (*controls, *targets)
 
 
 def _dedup_unique_2q_pairs(program: List[Instruction]) -> list:
@@ -285,20 +287,10 @@ def _rewrite(instr: Instruction, layout: dict) -> Instruction:
         [layout[q] for q in instr.target_qubits] if instr.target_qubits else []
     )
     new_controls = (
-        [layout[q] for q in instr.control_qubits] if instr.control_qubits else []
-    )
-    out = Instruction(
-        symbol=instr.symbol,
-        modifies_state=instr.modifies_state,
-        is_controlled=instr.is_controlled,
-        target_qubits=new_targets,
-        control_qubits=new_controls,
-        params=instr.params,
-        shots=instr.shots,
+        [layout[q] for q in instr.control_qubits] if instr.control_qubits else None
     )
-    out.instruction_type = InstructionType.DELAYED
-    out.pre = instr.pre.copy()
-    out.post = instr.post.copy()
+    out = instr.with_qubits(new_targets, new_controls)
+    out.instruction_type = _DELAYED
     out.is_mapped = True
     return out
 
@@ -534,7 +526,6 @@ class LookaheadSwapInsertion(Pass):
         # Used to prevent immediate (a,b)·(a,b) oscillation.
         last_swap_pair: Optional[tuple] = None
         emitted: list = []
-        queue = list(program)
         swap_emitted = False  # Perf #4: track whether any SWAP was inserted.
 
         # Identity permutation: current_layout[p] = p for all physical qubits.
@@ -547,42 +538,42 @@ class LookaheadSwapInsertion(Pass):
         last_head_dist = None
         cap = _stall_cap(topology)
 
-        while queue:
+        # The front layer is advanced incrementally: `head` is a cursor into
+        # the program rather than popping from the front of a list (O(G) per
+        # pop), and 2q pairs plus the positions of 2q gates are computed once,
+        # so each lookahead window is a bisect plus a slice of at most
+        # LOOKAHEAD_K entries instead of a rescan of the remaining program.
+        pairs = [_two_qubit_qubits(instr) for instr in program]
+        two_q_at = [k for k, pair in enumerate(pairs) if pair is not None]
+        n = len(program)
+        head = 0
+
+        while head < n:
             # Step 1: Drain leading 1q / measure / reset / adjacent 2q gates.
-            progressed = True
-            while progressed and queue:
-                progressed = False
-                head = queue[0]
-                pair = _two_qubit_qubits(head)
-                if pair is None:
-                    # 1q gate, measure, or reset: emit with qubit rewrite.
-                    emitted.append(_rewrite(head, current_layout))
-                    queue.pop(0)
-                    progressed = True
-                    continue
-                # 2q gate: check adjacency under current layout.
-                p0 = current_layout[pair[0]]
-                p1 = current_layout[pair[1]]
-                if topology.internal.has_edge(p0, p1):
-                    emitted.append(_rewrite(head, current_layout))
-                    queue.pop(0)
-                    progressed = True
-
-            if not queue:
+            while head < n:
+                pair = pairs[head]
+                if pair is not None:
+                    # 2q gate: check adjacency under current layout.
+                    p0 = current_layout[pair[0]]
+                    p1 = current_layout[pair[1]]
+                    if not topology.internal.has_edge(p0, p1):
+                        break
+                # 1q gate, measure, reset, or adjacent 2q: emit with qubit rewrite.
+                emitted.append(_rewrite(program[head], current_layout))
+                head += 1
+
+            if head == n:
                 break
 
             # Step 2: Head is a non-adjacent 2q gate.
-            head = queue[0]
-            head_pair = _two_qubit_qubits(head)
-            front = [head]
-
-            # Build lookahead: next LOOKAHEAD_K 2q gates in the queue.
-            lookahead: list = []
-            for instr in queue[1:]:
-                if _two_qubit_qubits(instr) is not None:
-                    lookahead.append(instr)
-                    if len(lookahead) >= LOOKAHEAD_K:
-                        break
+            head_pair = pairs[head]
+            front = [program[head]]
+
+            # Build lookahead: next LOOKAHEAD_K 2q gates after the head.
+            start = bisect_right(two_q_at, head)
+            lookahead: list = [
+                program[k] for k in two_q_at[start:start + LOOKAHEAD_K]
+            ]
 
             # Step 3: Build candidate SWAP set — topology edges incident to
             # the physical qubits currently used by the front layer.
@@ -774,20 +765,10 @@ class LayoutSelection:
             new_controls = (
                 [layout[q] for q in instr.control_qubits]
                 if instr.control_qubits
-                else []
-            )
-            m = Instruction(
-                symbol=instr.symbol,
-                modifies_state=instr.modifies_state,
-                is_controlled=instr.is_controlled,
-                target_qubits=new_targets,
-                control_qubits=new_controls,
-                params=instr.params,
-                shots=instr.shots,
+                else None
             )
-            m.instruction_type = InstructionType.DELAYED
-            m.pre = instr.pre.copy()
-            m.post = instr.post.copy()
+            m = instr.with_qubits(new_targets, new_controls)
+            m.instruction_type = _DELAYED
             m.is_mapped = True
             mapped.append(m)
 
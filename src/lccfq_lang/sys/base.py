@@ -10,26 +10,31 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 from .error import BadQPUConfiguration
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QPUConnection:
     ip: str
     port: int
 
 
+@dataclass(frozen=True, slots=True)
 class QPUConfig:
     """Representation of the configuration that a QPU requires to operate inside LCCF.
+
+    Configurations loaded from file are cached and shared between QPU instances,
+    so the configuration is frozen and qubit, coupling and exclusion lists are
+    stored as tuples.
     """
     name: str
     location: str
     topology: str
     qubit_count: int
-    qubits: List[int]
-    couplings: List[int]
-    exclusions: List[int]
+    qubits: Tuple[int, ...]
+    couplings: Tuple[Tuple[int, int], ...]
+    exclusions: Tuple[int, ...]
     connection: QPUConnection
 
     def __init__(self, data: dict):
@@ -60,11 +65,13 @@ class QPUConfig:
             port=network_data["port"]
         )
 
-        self.name = spec["name"]
-        self.location = spec["location"]
-        self.topology = spec["topology"]
-        self.qubit_count = int(spec["qubit_count"])
-        self.qubits = spec["qubits"]
-        self.couplings = spec["couplings"]
-        self.exclusions = spec["exclusions"]
-        self.connection = connection
+        # Frozen dataclass: fields are set through object.__setattr__
+        setfield = object.__setattr__
+        setfield(self, "name", spec["name"])
+        setfield(self, "location", spec["location"])
+        setfield(self, "topology", spec["topology"])
+        setfield(self, "qubit_count", int(spec["qubit_count"]))
+        setfield(self, "qubits", tuple(spec["qubits"]))
+        setfield(self, "couplings", tuple(tuple(c) for c in spec["couplings"]))
+        setfield(self, "exclusions", tuple(spec["exclusions"]))
+        setfield(self, "connection", connection)
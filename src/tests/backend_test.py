@@ -9,12 +9,14 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+from dataclasses import FrozenInstanceError
 import toml
 import pytest
 
 from lccfq_lang.backend import QPU, QPUStatus
 from lccfq_lang.mach.ir import Gate
 from lccfq_lang.arch.instruction import Instruction
+from lccfq_lang.sys.error import BadQPUConfiguration
 
 
 @pytest.fixture
@@ -79,6 +81,12 @@ def test_exec_circuit_returns_empty_dict(qpu_instance):
     assert result == {}
 
 
+def test_exec_batch_returns_one_result_per_instruction(qpu_instance):
+    qpu = qpu_instance
+    instrs = [qpu.isa.x(tg=0, shots=10), qpu.isa.h(tg=1, shots=20)]
+    assert qpu.exec_batch(instrs, [10, 20]) == [None, None]
+
+
 def test_qpu_last_pass_stored_correctly(tmp_path, valid_qpu_config_dict):
     config_path = tmp_path / "qpu_config.toml"
     with open(config_path, "w") as f:
@@ -100,4 +108,74 @@ def test_qpu_invalid_last_pass_defaults(tmp_path, valid_qpu_config_dict):
 
 def test_bridge_method_exists(qpu_instance):
     # Not executed (it's a no-op), just confirms existence
-    assert hasattr(qpu_instance, "_QPU__bridge")
\ No newline at end of file
+    assert hasattr(qpu_instance, "_QPU__bridge")
+
+
+def test_qpu_config_cached_per_file(tmp_path, valid_qpu_config_dict):
+    config_path = tmp_path / "qpu_config.toml"
+    with open(config_path, "w") as f:
+        toml.dump(valid_qpu_config_dict, f)
+
+    qpu_a = QPU(filename=str(config_path))
+    qpu_b = QPU(filename=str(config_path))
+    assert qpu_a.config is qpu_b.config
+
+
+def test_qpu_config_shared_but_immutable(tmp_path, valid_qpu_config_dict):
+    config_path = tmp_path / "qpu_config.toml"
+    with open(config_path, "w") as f:
+        toml.dump(valid_qpu_config_dict, f)
+
+    qpu_a = QPU(filename=str(config_path))
+
+    with pytest.raises(AttributeError):
+        qpu_a.config.exclusions.append(0)
+    with pytest.raises(AttributeError):
+        qpu_a.config.qubits.append(99)
+
+    qpu_b = QPU(filename=str(config_path))
+    assert qpu_b.config.exclusions == tuple(valid_qpu_config_dict["qpu"]["exclusions"])
+    assert qpu_b.mapping.topology.qubits() == qpu_a.mapping.topology.qubits()
+
+
+def test_qpu_config_scalar_fields_read_only(tmp_path, valid_qpu_config_dict):
+    config_path = tmp_path / "qpu_config.toml"
+    with open(config_path, "w") as f:
+        toml.dump(valid_qpu_config_dict, f)
+
+    qpu_a = QPU(filename=str(config_path))
+
+    with pytest.raises(FrozenInstanceError):
+        qpu_a.config.qubit_count = 99
+    with pytest.raises(FrozenInstanceError):
+        qpu_a.config.name = "other"
+    with pytest.raises(FrozenInstanceError):
+        qpu_a.config.qubits = (0,)
+
+    qpu_b = QPU(filename=str(config_path))
+    assert qpu_b.config.qubit_count == valid_qpu_config_dict["qpu"]["qubit_count"]
+    assert qpu_b.config.name == valid_qpu_config_dict["qpu"]["name"]
+
+
+def test_qpu_config_cache_invalidated_on_edit(tmp_path, valid_qpu_config_dict):
+    config_path = tmp_path / "qpu_config.toml"
+    with open(config_path, "w") as f:
+        toml.dump(valid_qpu_config_dict, f)
+
+    first = QPU(filename=str(config_path)).config
+
+    valid_qpu_config_dict["qpu"]["location"] = "lab4242"
+    with open(config_path, "w") as f:
+        toml.dump(valid_qpu_config_dict, f)
+
+    second = QPU(filename=str(config_path)).config
+    assert second is not first
+    assert second.location == "lab4242"
+
+
+def test_qpu_invalid_toml_raises(tmp_path):
+    config_path = tmp_path / "broken.toml"
+    config_path.write_text("[qpu\nname = ")
+
+    with pytest.raises(BadQPUConfiguration):
+        QPU(filename=str(config_path))
@@ -10,6 +10,7 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 import pytest
+from lccfq_lang.arch import error as arch_error
 from lccfq_lang.sys.base import QPUConfig, QPUConnection
 from lccfq_lang.sys.error import BadQPUConfiguration
 
@@ -40,13 +41,15 @@ def test_qpu_config_initialization(sample_config_dict):
     assert config.location == "lab42"
     assert config.topology == "linear"
     assert config.qubit_count == 4
-    assert config.qubits == [0, 1, 2, 3]
-    assert config.couplings == [(0, 1), (1, 2), (2, 3)]
-    assert config.exclusions == []
+    assert config.qubits == (0, 1, 2, 3)
+    assert config.couplings == ((0, 1), (1, 2), (2, 3))
+    assert config.exclusions == ()
 
     assert isinstance(config.connection, QPUConnection)
     assert config.connection.ip == "192.168.1.10"
     assert config.connection.port == 4242
+    assert not hasattr(config, "__dict__")
+    assert not hasattr(config.connection, "__dict__")
 
 
 def test_missing_qpu_section_raises():
@@ -79,4 +82,8 @@ def test_missing_network_fields_raises(sample_config_dict):
 
 def test_empty_dict_raises():
     with pytest.raises(BadQPUConfiguration):
-        QPUConfig({})
\ No newline at end of file
+        QPUConfig({})
+
+
+def test_bad_configuration_error_has_single_definition():
+    assert arch_error.BadQPUConfiguration is BadQPUConfiguration
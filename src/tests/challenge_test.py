@@ -11,7 +11,7 @@ Contact: nunezco2@illinois.edu
 """
 import pytest
 from lccfq_lang.arch.isa import ISA
-from lccfq_lang.arch.instruction import InstructionType
+from lccfq_lang.arch.instruction import Instruction, InstructionType
 from lccfq_lang.arch.register import QContext, QRegister
 from lccfq_lang.arch.error import MalformedInstruction, NotAllowedInContext
 
@@ -73,4 +73,23 @@ def test_control_instruction_with_no_context():
     reg = QRegister(qubit_count=2, mapping=None, isa=None)
 
     challenged = reg.challenge(instr, None)
-    assert challenged.instruction_type == InstructionType.QPUSTATE
\ No newline at end of file
+    assert challenged.instruction_type == InstructionType.QPUSTATE
+
+
+@pytest.mark.parametrize("instr", [
+    Instruction("", target_qubits=[0]),
+    Instruction("x", target_qubits=[]),
+    Instruction("x", target_qubits=[-1]),
+    Instruction("x", target_qubits=[0.0]),
+    Instruction("cx", is_controlled=True, target_qubits=[1], control_qubits=None),
+    Instruction("cx", is_controlled=True, target_qubits=[1], control_qubits=[-2]),
+    Instruction("cx", is_controlled=True, target_qubits=[1], control_qubits=[1]),
+    Instruction("rz", target_qubits=[0], params=(0.5,)),
+    Instruction("rz", target_qubits=[0], params=[0.5, 1]),
+    Instruction("x", target_qubits=[0], shots=0),
+])
+def test_malformed_instruction_raises(instr):
+    reg = QRegister(qubit_count=2, mapping=None, isa=None)
+
+    with pytest.raises(MalformedInstruction):
+        reg.challenge(instr, QContext.CIRCUIT)
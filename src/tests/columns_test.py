@@ -0,0 +1,91 @@
+"""
+Filename: columns_test.py
+Author: Santiago Nunez-Corrales
+Date: 2026-05-20
+Version: 1.0
+Description:
+    Tests for the columnar instruction snapshot and Circuit.view.
+
+License: Apache 2.0
+Contact: nunezco2@illinois.edu
+"""
+import numpy as np
+import pytest
+from pathlib import Path
+
+from lccfq_lang.arch.columns import InstructionColumns
+from lccfq_lang.arch.context import Circuit
+from lccfq_lang.arch.error import UnknownInstruction
+from lccfq_lang.arch.isa import ISA
+from lccfq_lang.arch.register import CRegister
+from lccfq_lang.backend import QPU
+
+
+CONFIG = str(Path(__file__).parent / "data" / "testing.toml")
+
+
+@pytest.fixture
+def isa():
+    return ISA("test")
+
+
+def test_columns_empty():
+    cols = InstructionColumns.from_instructions([])
+    assert len(cols) == 0
+    assert cols.targets.shape == (0, 0)
+    assert cols.params.shape == (0, 0)
+
+
+def test_columns_pad_ragged_fields(isa):
+    cols = InstructionColumns.from_instructions([
+        isa.h(tg=2),
+        isa.cx(ct=0, tg=1),
+        isa.u3(tg=3, params=[0.1, 0.2, 0.3]),
+        isa.measure(tgs=[0, 1, 2]),
+    ])
+
+    assert len(cols) == 4
+    assert cols.symbols.tolist() == ["h", "cx", "u3", "measure"]
+    assert cols.targets.dtype == np.int32
+    assert cols.targets.tolist() == [[2, -1, -1], [1, -1, -1], [3, -1, -1], [0, 1, 2]]
+    assert cols.controls.tolist() == [[-1], [0], [-1], [-1]]
+    assert np.isnan(cols.params[0]).all()
+    assert cols.params[2].tolist() == [0.1, 0.2, 0.3]
+
+
+def test_circuit_view_reflects_instructions():
+    qpu = QPU(filename=CONFIG, last_pass="parsed")
+    qreg = qpu.qregister(2)
+
+    with Circuit(qreg, CRegister(2), qpu) as c:
+        c >> qpu.isa.h(tg=0)
+        c >> qpu.isa.cx(ct=0, tg=1)
+
+    cols = c.view()
+    assert cols.symbols.tolist() == ["h", "cx"]
+    assert cols.targets[:, 0].tolist() == [0, 1]
+    assert cols.controls[:, 0].tolist() == [-1, 0]
+
+
+def test_apply_many_matches_per_instruction_columns(isa):
+    bulk = isa.apply_many("crz", np.arange(1, 4), controls=np.zeros(3), params=[0.1, 0.2, 0.3])
+    single = InstructionColumns.from_instructions(
+        [isa.crz(ct=0, tg=q, params=[p]) for q, p in zip(range(1, 4), [0.1, 0.2, 0.3])]
+    )
+
+    assert bulk.symbols.tolist() == single.symbols.tolist()
+    assert bulk.targets.dtype == np.int32
+    assert np.array_equal(bulk.targets, single.targets)
+    assert np.array_equal(bulk.controls, single.controls)
+    assert np.array_equal(bulk.params, single.params)
+
+    hs = isa.apply_many("h", np.arange(4))
+    assert hs.controls.shape == (4, 0) and hs.params.shape == (4, 0)
+
+
+def test_apply_many_rejects_bad_input(isa):
+    with pytest.raises(UnknownInstruction):
+        isa.apply_many("resfreq", [0])
+
+    with pytest.raises(ValueError):
+        isa.apply_many("cx", [1, 2], controls=[0])
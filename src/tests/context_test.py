@@ -14,7 +14,7 @@ from pathlib import Path
 
 from lccfq_lang.arch.context import CompilerPass, CompilationPipeline, Circuit, Test
 from lccfq_lang.arch.register import CRegister, QContext
-from lccfq_lang.arch.instruction import Instruction
+from lccfq_lang.arch.instruction import Instruction, InstructionType
 from lccfq_lang.arch.error import UnknownCompilerPass
 from lccfq_lang.backend import QPU
 
@@ -113,6 +113,19 @@ def test_circuit_parsed_pass_populates_creg(qpu_parsed):
     assert all(v == -1 for v in creg.data.values())
 
 
+def test_circuit_unexecuted_results_not_shared(qpu_parsed):
+    qpu = qpu_parsed
+    cregs = [CRegister(3), CRegister(3)]
+
+    for creg in cregs:
+        with Circuit(qpu.qregister(3), creg, qpu, shots=10) as c:
+            c >> qpu.isa.x(tg=0)
+
+    assert list(cregs[0].data) == [format(i, "03b") for i in range(8)]
+    assert cregs[0].data == cregs[1].data
+    assert cregs[0].data is not cregs[1].data
+
+
 def test_circuit_mapped_pass_populates_creg(qpu_mapped):
     qpu = qpu_mapped
     qreg = qpu.qregister(2)
@@ -174,10 +187,68 @@ def test_circuit_instructions_are_challenged(qpu_transpiled):
     # The stored instruction should be a different object (deep copy)
     assert c.instructions[0] is not original
     # And should have CIRCUIT instruction type
-    from lccfq_lang.arch.instruction import InstructionType
     assert c.instructions[0].instruction_type == InstructionType.CIRCUIT
 
 
+def test_circuit_extend_matches_rshift(qpu_transpiled):
+    """extend() must challenge and append exactly like repeated >>."""
+    qpu = qpu_transpiled
+    qreg = qpu.qregister(2)
+    block = [qpu.isa.h(tg=0), qpu.isa.cx(ct=0, tg=1), qpu.isa.x(tg=1)]
+
+    with Circuit(qreg, CRegister(2), qpu) as one_by_one:
+        for instr in block:
+            one_by_one >> instr
+
+    with Circuit(qreg, CRegister(2), qpu) as batched:
+        batched.extend(block)
+        batched.extend(block)
+
+    assert len(batched.instructions) == 2 * len(one_by_one.instructions)
+    assert [i.symbol for i in batched.instructions[:3]] == [i.symbol for i in one_by_one.instructions]
+    assert all(i.instruction_type == InstructionType.CIRCUIT for i in batched.instructions)
+    # Reused blocks must not alias the stored instructions
+    assert batched.instructions[0] is not batched.instructions[3]
+    assert not any(i is b for i in batched.instructions for b in block)
+
+
+def test_circuit_irshift_batches(qpu_transpiled):
+    qpu = qpu_transpiled
+    qreg = qpu.qregister(2)
+
+    with Circuit(qreg, CRegister(2), qpu) as c:
+        circuit = c
+        c >>= [qpu.isa.h(tg=0), qpu.isa.cx(ct=0, tg=1)]
+        c >> qpu.isa.x(tg=1)
+
+    assert c is circuit
+    assert [i.symbol for i in c.instructions] == ["h", "cx", "x"]
+
+
+def test_circuit_parsed_dry_run_skips_challenge(qpu_parsed):
+    qpu = qpu_parsed
+    qreg = qpu.qregister(2)
+    gate = qpu.isa.x(tg=0)
+
+    with Circuit(qreg, CRegister(2), qpu) as c:
+        c >> gate
+        c.extend([gate])
+
+    assert [i.symbol for i in c.instructions] == ["x", "x"]
+    assert all(i is not gate for i in c.instructions)
+    assert all(i.instruction_type == gate.instruction_type for i in c.instructions)
+
+    c.instructions[0].is_mapped = True
+    c.instructions[1].add_precondition("p")
+    assert qpu.isa.x(tg=0).is_mapped is False
+    assert qpu.isa.x(tg=0).pre == frozenset()
+
+    with Circuit(qreg, CRegister(2), qpu, verbose=True) as c:
+        c >> gate
+
+    assert c.instructions[0] is not gate
+
+
 def test_circuit_results_and_frequencies(qpu_parsed):
     qpu = qpu_parsed
     qreg = qpu.qregister(2)
@@ -220,3 +291,19 @@ def test_test_context_multiple_instructions(qpu_transpiled):
     assert len(accum) == 2
     assert 0 in accum
     assert 1 in accum
+
+
+def test_test_context_submits_one_batch(qpu_transpiled, monkeypatch):
+    qpu = qpu_transpiled
+    qreg = qpu.qregister(2)
+    calls = []
+    monkeypatch.setattr(qpu, "exec_batch",
+                        lambda instrs, shots: calls.append(shots) or [s * 2 for s in shots])
+    accum = {}
+
+    with Test(qreg, accum, qpu) as t:
+        t >> qpu.isa.x(tg=0, shots=100)
+        t >> qpu.isa.h(tg=1, shots=200)
+
+    assert calls == [[100, 200]]
+    assert accum == {0: 200, 1: 400}
@@ -0,0 +1,79 @@
+"""
+Filename: grover_example_test.py
+Author: Santiago Nunez-Corrales
+Date: 2026-10-16
+Version: 1.0
+Description:
+    Checks a fused ideal simulation of the iteration block of examples/grover.py
+    against a gate-by-gate simulation of the same circuit.
+
+License: Apache 2.0
+Contact: nunezco2@illinois.edu
+"""
+import importlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lccfq_lang import ISA
+
+EXAMPLES = Path(__file__).resolve().parents[2] / "examples"
+
+
+@pytest.fixture
+def examples(monkeypatch):
+    monkeypatch.syspath_prepend(str(EXAMPLES))
+    return importlib.import_module("grover"), importlib.import_module("xeb_util")
+
+
+def ideal_probabilities(u, n_qubits, n_iterations):
+    """Noiseless outcome distribution of the search, applying the fused
+    iteration unitary once per iteration to the uniform superposition.
+
+    :param u: 2^n x 2^n unitary of one iteration block
+    :param n_qubits: number of qubits
+    :param n_iterations: number of Grover iterations
+    :return: probabilities indexed by the integer value of each bitstring
+    """
+    state = np.full(1 << n_qubits, 2 ** (-n_qubits / 2), dtype=np.complex64)
+
+    for _ in range(n_iterations):
+        state = u @ state
+
+    return np.abs(state) ** 2
+
+
+@pytest.mark.skipif(not (EXAMPLES / "grover.py").exists(), reason="grover.py not present")
+def test_ideal_probabilities_match_gate_by_gate(examples):
+    grover, xeb_util = examples
+    isa = ISA("test")
+    marked_bits, n_qubits, n_iterations = (0, 1, 0, 1), 4, 3
+    block = grover.grover_iteration(isa, marked_bits, n_qubits)
+    simulator = xeb_util.XEBSimulator()
+
+    fused = ideal_probabilities(simulator.unitary(block, n_qubits), n_qubits, n_iterations)
+
+    circuit = [isa.h(tg=q) for q in range(n_qubits)]
+    circuit += block * n_iterations
+    reference = simulator.probabilities(circuit, n_qubits)
+
+    assert np.allclose(fused, reference, atol=1e-5)
+
+
+@pytest.mark.skipif(not (EXAMPLES / "grover.py").exists(), reason="grover.py not present")
+def test_block_unitary_columns_match_gate_by_gate(examples):
+    grover, xeb_util = examples
+    isa = ISA("test")
+    marked_bits, n_qubits = (0, 1, 0, 1), 4
+    block = list(grover.grover_iteration(isa, marked_bits, n_qubits))
+    simulator = xeb_util.XEBSimulator()
+
+    u = simulator.unitary(block, n_qubits)
+
+    for k in range(1 << n_qubits):
+        # Basis state |k>, with qubit 0 as the least significant bit of k
+        prepare = [isa.x(tg=q) for q in range(n_qubits) if (k >> q) & 1]
+        reference = simulator.probabilities(prepare + block, n_qubits)
+
+        assert np.allclose(np.abs(u[:, k]) ** 2, reference, atol=1e-5)
@@ -11,6 +11,7 @@ Contact: nunezco2@illinois.edu
 """
 import pytest
 
+from lccfq_lang.arch.columns import InstructionColumns
 from lccfq_lang.arch.instruction import Instruction, InstructionType
 from lccfq_lang.arch.isa import ISA
 from lccfq_lang.arch.mapping import QPUMapping
@@ -79,6 +80,38 @@ def test_map_instruction(topology):
     assert mapped.instruction_type == InstructionType.DELAYED
 
 
+def test_map_keeps_absent_controls_absent(topology, isa):
+    mapping = QPUMapping([0, 1], topology)
+    mapped = mapping.map(isa.h(tg=0))
+
+    assert mapped.control_qubits is None
+    assert mapped.target_qubits[0] in topology.qubits()
+
+
+def test_map_columns_matches_map(topology, isa):
+    mapping = QPUMapping([0, 1, 2], topology).with_layout({0: 2, 1: 0, 2: 1})
+    program = [isa.h(tg=0), isa.cx(ct=0, tg=1), isa.x(tg=2)]
+
+    cols = mapping.map_columns(InstructionColumns.from_instructions(program))
+    expected = InstructionColumns.from_instructions([mapping.map(i) for i in program])
+
+    assert cols.targets.tolist() == expected.targets.tolist()
+    assert cols.controls.tolist() == [[-1], [2], [-1]]
+
+
+def test_map_columns_unknown_qubit_raises(topology, isa):
+    mapping = QPUMapping([0, 1], topology)
+
+    with pytest.raises(KeyError):
+        mapping.map_columns(InstructionColumns.from_instructions([isa.x(tg=2)]))
+
+    with pytest.raises(KeyError):
+        mapping.map(isa.x(tg=-3))
+
+    with pytest.raises(KeyError):
+        mapping.map_columns(InstructionColumns.from_instructions([isa.x(tg=-3)]))
+
+
 def test_swaps_delegation(monkeypatch, topology, isa):
     instr = Instruction(
         symbol="cx",
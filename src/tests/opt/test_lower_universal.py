@@ -198,6 +198,49 @@ class TestLowerCU:
         pass_.run(program, ctx)
         assert [id(x) for x in program] == original_ids
 
+    def test_lower_cu_reuses_repeated_decompositions(self, qpu, ctx):
+        def cu(tg, params):
+            return Instruction(symbol="cu", is_controlled=True, target_qubits=[tg],
+                               control_qubits=[0], params=params)
+
+        program = [cu(1, [0.1, 0.2, 0.3]), cu(1, [0.1, 0.2, 0.3]), cu(2, [0.1, 0.2, 0.3])]
+        result, _ = LowerCU(qpu.isa).run(program, ctx)
+
+        assert len(result) == 21
+        assert all(a is b for a, b in zip(result[:7], result[7:14]))
+        assert result[14].target_qubits == [2]
+        assert [_instr_tuple(i) for i in result[:7]] == \
+            [_instr_tuple(i) for i in LowerCU(qpu.isa).run(program[:1], ctx)[0]]
+
+    def test_lower_cu_shared_decompositions_are_read_only(self, qpu, ctx):
+        instr = Instruction(symbol="cu", is_controlled=True, target_qubits=[1],
+                            control_qubits=[0], params=[0.1, 0.2, 0.3])
+        pass_ = LowerCU(qpu.isa)
+        first, _ = pass_.run([instr], ctx)
+
+        with pytest.raises(AttributeError):
+            first[0].is_mapped = True
+        with pytest.raises(AttributeError):
+            first[0].add_precondition("p")
+
+        annotated = first[0].thaw()
+        annotated.is_mapped = True
+        annotated.target_qubits[0] = 5
+
+        again, _ = pass_.run([instr], ctx)
+        assert again[0].target_qubits == [1]
+        assert again[0].is_mapped is False
+
+    def test_lower_cu_unhashable_params_not_memoized(self, qpu, ctx):
+        instr = Instruction(symbol="cu", is_controlled=True, target_qubits=[1],
+                            control_qubits=[0], params=[np.array(0.1), 0.2, 0.3])
+        pass_ = LowerCU(qpu.isa)
+        result, _ = pass_.run([instr, instr], ctx)
+
+        assert len(result) == 14
+        assert result[0] is not result[7]
+        assert pass_._memo == {}
+
 
 # ---------------------------------------------------------------------------
 # FanoutMeasure tests
@@ -245,6 +288,46 @@ class TestFanoutMeasure:
         assert result[0] is program[0]
 
 
+    def test_fanout_measure_keeps_prefix_and_returns_new_list(self, qpu, ctx):
+        prefix = [qpu.isa.x(tg=0), qpu.isa.h(tg=1)]
+        program = prefix + [qpu.isa.measure(tgs=[0, 1]), qpu.isa.y(tg=2)]
+        pass_ = FanoutMeasure(qpu.isa)
+        result, changed = pass_.run(program, ctx)
+        assert changed is True
+        assert result[0] is prefix[0] and result[1] is prefix[1]
+        assert [i.symbol for i in result] == ["x", "h", "measure", "measure", "y"]
+        assert result[-1] is program[-1]
+
+    def test_fanout_measure_no_match_returns_new_list(self, qpu, ctx):
+        program = [qpu.isa.x(tg=0)]
+        pass_ = FanoutMeasure(qpu.isa)
+        result, changed = pass_.run(program, ctx)
+        assert changed is False
+        assert result == program
+        assert result is not program
+
+    def test_fanout_measure_reuses_single_measures(self, qpu, ctx):
+        program = [qpu.isa.measure(tgs=[0, 1]), qpu.isa.measure(tgs=[1, 2])]
+        pass_ = FanoutMeasure(qpu.isa)
+        result, _ = pass_.run(program, ctx)
+        assert [i.target_qubits for i in result] == [[0], [1], [1], [2]]
+        assert result[1] is result[2]
+        assert pass_.run(program, ctx)[0][0] is result[0]
+
+    def test_fanout_measure_shared_measures_are_read_only(self, qpu, ctx):
+        pass_ = FanoutMeasure(qpu.isa)
+        result, _ = pass_.run([qpu.isa.measure(tgs=[0, 1])], ctx)
+
+        with pytest.raises(AttributeError):
+            result[0].is_mapped = True
+        with pytest.raises(TypeError):
+            result[0].target_qubits[0] = 5
+
+        again, _ = pass_.run([qpu.isa.measure(tgs=[0, 2])], ctx)
+        assert again[0].target_qubits == [0]
+        assert again[0].is_mapped is False
+
+
 # ---------------------------------------------------------------------------
 # Integration tests — lower_expand group via PassManager
 # ---------------------------------------------------------------------------
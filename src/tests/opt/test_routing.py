@@ -13,8 +13,10 @@ from __future__ import annotations
 import pytest
 from lccfq_lang.arch.instruction import Instruction, InstructionType
 from lccfq_lang.arch.isa import ISA
+from lccfq_lang.arch.error import MalformedInstruction
 from lccfq_lang.arch.mapping import QPUMapping
 from lccfq_lang.mach.topology import QPUTopology
+from lccfq_lang.opt.builtin.lower_passes import SwappedPass
 from lccfq_lang.opt.builtin.routing import (
     LookaheadSwapInsertion,
     LayoutSelection,
@@ -446,7 +448,7 @@ def test_bfs_distance_correctness(topo4):
 
 def test_rewrite_preserves_attributes(isa):
     """_rewrite must copy all attributes and remap qubit indices."""
-    instr = isa.cx(ct=0, tg=1)
+    instr = isa.cx(ct=0, tg=1).thaw()
     instr.is_mapped = True
     layout = {0: 2, 1: 3}
     out = _rewrite(instr, layout)
@@ -1029,3 +1031,43 @@ def test_perf12_routing_is_still_deterministic(isa, topo4, ctx4):
     assert repr(out1) == repr(out2), (
         "LookaheadSwapInsertion produced non-deterministic output after Perf #12"
     )
+
+
+def test_routing_does_not_consume_input_program(isa, topo4, ctx4):
+    """The head cursor walks the program in place; the input list is left intact
+    and interleaved 1q gates keep their relative order."""
+    program = [
+        _make_mapped(isa.h(tg=0)),
+        _make_mapped(isa.cx(ct=0, tg=3)),
+        _make_mapped(isa.x(tg=2)),
+        _make_mapped(isa.cx(ct=1, tg=3)),
+        _make_mapped(isa.h(tg=1)),
+    ]
+    snapshot = list(program)
+    pass_inst = LookaheadSwapInsertion(qreg=None, isa=isa, topology=topo4)
+    result, _ = pass_inst.run(program, ctx4)
+
+    assert program == snapshot
+    assert [i.symbol for i in result if i.symbol != "swap"] == ["h", "cx", "x", "cx", "h"]
+
+
+def test_swapped_pass_rejects_unmapped_input(isa, topo4, ctx4):
+    """SwappedPass routes physical qubits only; a virtual instruction is an error."""
+    qreg = _make_qreg([0, 1, 2, 3], topo4, isa)
+    pass_inst = SwappedPass(qreg, isa)
+
+    with pytest.raises(MalformedInstruction):
+        pass_inst.run([_make_mapped(isa.h(tg=0)), isa.cx(ct=0, tg=3)], ctx4)
+
+
+def test_swapped_pass_routes_through_register(isa, topo4, ctx4, monkeypatch):
+    """SwappedPass goes through QRegister.needs_swap/swaps, not the topology."""
+    qreg = _make_qreg([0, 1, 2, 3], topo4, isa)
+    calls = []
+    forward = qreg.swaps
+    monkeypatch.setattr(qreg, "swaps", lambda instr, i: calls.append(instr) or forward(instr, i))
+
+    result, _ = SwappedPass(qreg, isa).run([_make_mapped(isa.cx(ct=0, tg=3))], ctx4)
+
+    assert len(calls) == 1
+    assert [i.symbol for i in result].count("swap") == 4
@@ -19,6 +19,7 @@ from lccfq_lang.lang.preparation import (
     prepare_state,
 )
 from lccfq_lang.lang._common import _ucr
+from tests._sim import simulate
 
 
 @pytest.fixture
@@ -115,6 +116,10 @@ class TestPrepareBasisEndian:
         result = prepare_basis(isa, [0, 1], bitstring="10", endianness="big")
         assert ops(result) == [("x", [1])]
 
+    def test_big_endian_flips_in_target_order(self, isa):
+        result = prepare_basis(isa, [4, 5, 6, 7], bitstring="1101", endianness="big")
+        assert ops(result) == [("x", [4]), ("x", [6]), ("x", [7])]
+
 
 # ===========================================================================
 # prepare_basis — validation errors
@@ -129,6 +134,11 @@ class TestPrepareBasisErrors:
         with pytest.raises(ValueError, match="'0' and '1'"):
             prepare_basis(isa, [0, 1], bitstring="0x")
 
+    @pytest.mark.parametrize("bitstring", [b"10", ["1", "0"], 10])
+    def test_non_str_bitstring(self, isa, bitstring):
+        with pytest.raises(ValueError, match="'0' and '1'"):
+            prepare_basis(isa, [0, 1], bitstring=bitstring)
+
     def test_invalid_basis(self, isa):
         with pytest.raises(ValueError, match="Basis"):
             prepare_basis(isa, [0], bitstring="0", basis="W")
@@ -257,6 +267,13 @@ class TestPrepareStateThreeQubit:
         assert "ry" in syms
         assert len(result) > 0
 
+    def test_real_state_with_zero_pairs_is_exact(self, isa):
+        """Every level mixes live and fully-zero amplitude pairs."""
+        state = np.array([0.1, 0.0, 0.3, 0.0, 0.0, 0.0, 0.5, 0.8])
+        state /= np.linalg.norm(state)
+        out = simulate(prepare_state(isa, [0, 1, 2], state=state), 3)
+        assert abs(np.vdot(state, out)) == pytest.approx(1.0)
+
 
 # ===========================================================================
 # prepare_state — endianness
@@ -404,6 +421,10 @@ class TestBlockFactoryIntegration:
         assert len(result) == 3
         assert all(i.symbol == "h" for i in result)
 
+    def test_dispatch_unknown_block_raises(self, factory):
+        with pytest.raises(KeyError, match="Unknown block type"):
+            factory.block("QFT", [0, 1])
+
     def test_dispatch_prepare_state(self, factory):
         from lccfq_lang.lang.blocks import BlockType
         result = factory.block(
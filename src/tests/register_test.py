@@ -13,7 +13,7 @@ import numpy as np
 import pytest
 from lccfq_lang.arch.isa import ISA
 from lccfq_lang.arch.instruction import Instruction, InstructionType
-from lccfq_lang.arch.register import QRegister, CRegister, QContext
+from lccfq_lang.arch.register import QRegister, CRegister, QContext, bitstrings, bitstring_indices
 from lccfq_lang.arch.mapping import QPUMapping
 from lccfq_lang.arch.error import (
     MalformedInstruction, NotAllowedInContext, NoMeasurementsAvailable
@@ -62,6 +62,10 @@ def test_but_excludes_specified(qreg):
     assert set(result) == {0, 2}
 
 
+def test_but_keeps_register_order(qreg):
+    assert qreg.but(minus=[2, 9]) == [0, 1, 3]
+
+
 def test_but_all_returns_empty(qreg):
     result = qreg.but(minus=[0, 1, 2, 3])
     assert result == []
@@ -156,6 +160,14 @@ def test_swaps_far_qubits_more_swaps(qreg, isa):
     assert len(result_far) > len(result_near)
 
 
+def test_swaps_output_stays_mapped(qreg, isa):
+    mapped = qreg.map(isa.cx(ct=0, tg=3))
+    result = qreg.swaps(mapped, isa)
+
+    assert len(result) > 1
+    assert all(i.is_mapped for i in result)
+
+
 # ---------------------------------------------------------------------------
 # expand() — instruction decomposition
 # ---------------------------------------------------------------------------
@@ -355,3 +367,116 @@ def test_cregister_zero_total():
     freqs = creg.frequencies()
 
     assert all(v == 0.0 for v in freqs.values())
+
+
+def test_cregister_counts_array():
+    creg = CRegister(size=2)
+    creg.absorb({"00": 500, "01": 300, "10": 200})
+    counts = creg.counts_array()
+
+    assert counts.tolist() == [500, 300, 200, 0]
+
+
+def test_cregister_counts_array_no_data_raises():
+    creg = CRegister(size=2)
+    with pytest.raises(NoMeasurementsAvailable):
+        creg.counts_array()
+
+
+def test_cregister_frequencies_array():
+    creg = CRegister(size=2)
+    creg.absorb({"00": 500, "01": 300, "10": 200})
+    freqs = creg.frequencies()
+
+    assert creg.frequencies_array().tolist() == [freqs["00"], freqs["01"], freqs["10"], 0.0]
+
+    creg.absorb({"00": 0, "01": 0})
+    assert creg.frequencies_array().tolist() == [0.0] * 4
+
+    with pytest.raises(NoMeasurementsAvailable):
+        CRegister(size=2).frequencies_array()
+
+
+def test_cregister_absorb_counts():
+    dense = CRegister(size=2)
+    dense.absorb_counts(np.array([1, 2, 0, 3]))
+    sparse = CRegister(size=2)
+    sparse.absorb_counts({0: 1, 1: 2, 3: 3})
+
+    for creg in (dense, sparse):
+        assert creg.counts_array().tolist() == [1, 2, 0, 3]
+        assert creg.data == {"00": 1, "01": 2, "11": 3}
+
+    with pytest.raises(ValueError):
+        CRegister(size=2).absorb_counts(np.zeros(3))
+    with pytest.raises(ValueError):
+        CRegister(size=2).absorb_counts({4: 1})
+
+
+def test_cregister_absorb_shots():
+    creg = CRegister(size=2)
+    creg.absorb_shots(np.array([0, 1, 1, 3, 3, 3], dtype=np.uint64))
+
+    assert creg.counts_array().tolist() == [1, 2, 0, 3]
+    assert creg.data == {"00": 1, "01": 2, "11": 3}
+    assert creg.frequencies()["11"] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("outcomes", [[0, 4], [-1, 2], np.array([7], dtype=np.uint64)])
+def test_cregister_absorb_shots_out_of_range(outcomes):
+    with pytest.raises(ValueError):
+        CRegister(size=2).absorb_shots(outcomes)
+
+
+def test_cregister_data_assignment_resets_counts():
+    creg = CRegister(size=2)
+    creg.absorb_shots([3, 3])
+    creg.data = {"01": 4}
+
+    assert creg.data == {"01": 4}
+    assert creg.counts_array().tolist() == [0, 4, 0, 0]
+
+
+def test_cregister_data_is_read_only_snapshot():
+    counts = {"00": 1, "01": 2}
+    creg = CRegister(size=2)
+    creg.absorb(counts)
+    counts["01"] += 5
+
+    assert creg.counts_array().tolist() == [1, 2, 0, 0]
+
+    with pytest.raises(TypeError):
+        creg.data["01"] += 1
+
+    assert creg.counts_array().tolist() == [1, 2, 0, 0]
+    assert creg.frequencies_array().tolist() == pytest.approx([1 / 3, 2 / 3, 0.0, 0.0])
+
+
+def test_cregister_absorb_rejects_wide_bitstrings():
+    creg = CRegister(size=2)
+
+    with pytest.raises(ValueError):
+        creg.absorb({"00": 1, "100": 2})
+    with pytest.raises(ValueError):
+        creg.data = {"0000": 1}
+
+    creg.absorb({"1": 3})
+    assert creg.counts_array().tolist() == [0, 3, 0, 0]
+
+
+def test_bitstrings_match_format():
+    for width in range(0, 7):
+        assert bitstrings(np.arange(1 << width), width) == [format(i, f"0{width}b") for i in range(1 << width)]
+    assert bitstrings(np.array([], dtype=np.int64), 3) == []
+
+
+def test_bitstring_indices_inverts_bitstrings():
+    for width in range(1, 7):
+        outcomes = np.arange(1 << width)
+        assert bitstring_indices(bitstrings(outcomes, width), width).tolist() == outcomes.tolist()
+
+    assert bitstring_indices(["1", "011"], 3).tolist() == [1, 3]
+    assert bitstring_indices([], 3).tolist() == []
+
+    with pytest.raises(ValueError):
+        bitstring_indices(["012"], 3)
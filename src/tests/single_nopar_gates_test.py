@@ -9,10 +9,13 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import copy
+import pickle
 import pytest
 
 from lccfq_lang import ISA
-from lccfq_lang.arch.instruction import Instruction
+from lccfq_lang.arch.error import UnknownInstruction
+from lccfq_lang.arch.instruction import Instruction, InstructionType
 
 @pytest.mark.parametrize("gate", ["x", "y", "z", "h", "s", "sdg", "t", "tdg"])
 def test_sqg_no_par_gen(gate):
@@ -27,4 +30,178 @@ def test_sqg_no_par_gen(gate):
     assert instr.target_qubits == [0]
     assert instr.control_qubits is None
     assert instr.params is None
-    assert instr.shots == 1
\ No newline at end of file
+    assert instr.shots == 1
+
+
+@pytest.mark.parametrize("gate", ["x", "y", "z", "h", "s", "sdg", "t", "tdg"])
+def test_sqg_no_par_interned(gate):
+    isa = ISA("lccfq")
+    method = getattr(isa, gate)
+
+    assert method(tg=1) is method(tg=1)
+    assert method(tg=1) is not method(tg=2)
+    assert method(tg=1, shots=10) is not method(tg=1, shots=10)
+    assert ISA("lccfq").h(tg=1) is not isa.h(tg=1)
+
+
+def test_interned_instructions_are_read_only():
+    isa = ISA("lccfq")
+    h, cx = isa.h(tg=0), isa.cx(ct=0, tg=1)
+
+    with pytest.raises(AttributeError):
+        h.add_precondition("p")
+    with pytest.raises(AttributeError):
+        h.is_mapped = True
+    with pytest.raises(TypeError):
+        cx.target_qubits[0] = 5
+    with pytest.raises(TypeError):
+        cx.control_qubits.append(2)
+
+    assert isa.h(tg=0).pre == frozenset()
+    assert isa.h(tg=0).is_mapped is False
+    assert isa.cx(ct=0, tg=1).target_qubits == [1]
+    assert isa.cx(ct=0, tg=1).control_qubits == [0]
+
+
+def test_copies_of_interned_instructions_are_mutable():
+    isa = ISA("lccfq")
+
+    for clone in (copy.copy(isa.cx(ct=0, tg=1)), copy.deepcopy(isa.cx(ct=0, tg=1)),
+                  pickle.loads(pickle.dumps(isa.cx(ct=0, tg=1)))):
+        clone.is_mapped = True
+        clone.add_precondition("p")
+        clone.target_qubits = [5]
+
+        assert type(clone) is Instruction
+
+    shallow = copy.copy(isa.cx(ct=0, tg=1))
+    shallow.target_qubits.append(2)
+    shallow.control_qubits[0] = 3
+
+    thawed = isa.cx(ct=0, tg=1).thaw()
+    thawed.is_mapped = True
+    thawed.target_qubits.append(2)
+
+    fresh = isa.cx(ct=0, tg=1)
+    assert fresh.target_qubits == [1] and fresh.control_qubits == [0]
+    assert fresh.pre == frozenset() and not fresh.is_mapped
+
+    plain = isa.cx(ct=0, tg=1, shots=5)
+    assert plain.thaw() is plain
+
+
+def test_with_qubits_rewrites_operands_only():
+    isa = ISA("lccfq")
+    source = isa.crz(ct=0, tg=1, params=[0.5], shots=3)
+    source.add_precondition("p")
+
+    moved = source.with_qubits([4], [2])
+    moved.add_postcondition("q")
+
+    assert type(moved) is Instruction
+    assert (moved.symbol, moved.is_controlled, moved.params, moved.shots) == ("crz", True, [0.5], 3)
+    assert moved.target_qubits == [4] and moved.control_qubits == [2]
+    assert moved.pre == {"p"} and source.post == frozenset()
+
+    interned = isa.cx(ct=0, tg=1).with_qubits([3], [2])
+    interned.is_mapped = True
+    assert type(interned) is Instruction
+
+
+def test_instruction_uses_slots():
+    instr = ISA("lccfq").h(tg=0)
+
+    assert not hasattr(instr, "__dict__")
+
+    with pytest.raises(AttributeError):
+        instr.unknown_field = 1
+
+
+def test_instruction_conditions_allocated_on_first_add():
+    a = Instruction(symbol="x", target_qubits=[0])
+    b = Instruction(symbol="y", target_qubits=[1])
+    assert a.pre is b.pre
+    assert len(a.pre) == 0 and len(a.post) == 0
+
+    cond = object()
+    c = copy.deepcopy(a)
+    c.add_precondition(cond)
+    c.add_postcondition(cond)
+
+    assert cond in c.pre and cond in c.post
+    assert len(a.pre) == 0 and len(b.pre) == 0
+
+
+def test_instruction_signature_is_value_based():
+    a = Instruction(symbol="rx", target_qubits=[0], params=[0.5])
+    b = Instruction(symbol="rx", target_qubits=[0], params=[0.5])
+
+    assert a.signature() == b.signature() == ("rx", (0,), (), (0.5,))
+    assert a != b and hash(a) != hash(b)
+
+    b.target_qubits = [1]
+    assert a.signature() != b.signature()
+
+
+def test_instruction_copies():
+    a = Instruction(symbol="crz", is_controlled=True, target_qubits=[1], control_qubits=[0], params=[0.5])
+    a.is_mapped = True
+    cond = object()
+    a.add_precondition(cond)
+
+    shallow = copy.copy(a)
+    assert shallow is not a and shallow.target_qubits is a.target_qubits and shallow.pre is a.pre
+
+    deep = copy.deepcopy(a)
+    assert deep.signature() == a.signature() and deep.is_mapped and deep.is_controlled
+    assert deep.target_qubits is not a.target_qubits
+    assert deep.control_qubits is not a.control_qubits
+    assert deep.params is not a.params
+    assert deep.pre is not a.pre and len(deep.pre) == 1
+    assert deep.post is a.post
+
+
+def test_inherit_conditions_shares_only_empty_sets():
+    source = Instruction(symbol="x", target_qubits=[0])
+    plain = Instruction(symbol="x", target_qubits=[1])
+    plain.inherit_conditions(source)
+    assert plain.pre is source.pre and plain.post is source.post
+
+    cond = object()
+    source.add_precondition(cond)
+    derived = Instruction(symbol="x", target_qubits=[1])
+    derived.inherit_conditions(source)
+    derived.add_precondition(object())
+
+    assert cond in derived.pre and derived.pre is not source.pre
+    assert len(source.pre) == 1
+
+
+def test_isa_gate_dispatch():
+    isa = ISA("lccfq")
+
+    assert isa.gate("h")(tg=2) is isa.h(tg=2)
+    assert isa.gate("rx")(tg=0, params=[0.5]).params == [0.5]
+
+    with pytest.raises(UnknownInstruction):
+        isa.gate("resfreq")
+
+
+@pytest.mark.parametrize("gate, modifies, itype", [
+    ("nop", False, InstructionType.DELAYED),
+    ("measure", True, InstructionType.CIRCUIT),
+    ("reset", True, InstructionType.DELAYED),
+])
+def test_control_instr_gen(gate, modifies, itype):
+    isa = ISA("lccfq")
+    instr = getattr(isa, gate)(tgs=[0, 2])
+
+    assert getattr(isa, gate).__name__ == gate
+    assert instr.symbol == gate
+    assert instr.modifies_state is modifies
+    assert instr.is_controlled is False
+    assert instr.target_qubits == [0, 2]
+    assert instr.control_qubits is None
+    assert instr.params is None
+    assert instr.instruction_type == itype
+    assert getattr(isa, gate)([1]) is not getattr(isa, gate)([1])
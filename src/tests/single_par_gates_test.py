@@ -11,6 +11,7 @@ Contact: nunezco2@illinois.edu
 """
 import pytest
 
+from lccfq_lang.arch.error import BadParameterCount
 from lccfq_lang.arch.isa import ISA
 from lccfq_lang.arch.instruction import Instruction
 
@@ -36,4 +37,16 @@ def test_sqg_par_gen(gate):
     assert instr.target_qubits == [0]
     assert instr.control_qubits is None
     assert instr.params == [0.0] or instr.params == [0.0, 0.1] or instr.params == [0.0, 0.1, 0.2]
-    assert instr.shots == 1
\ No newline at end of file
+    assert instr.shots == 1
+
+
+@pytest.mark.parametrize("gate,params", [("rx", [0.1, 0.2]), ("u2", [0.1]), ("u3", [0.1, 0.2])])
+def test_sqg_par_bad_arity_raises(gate, params):
+    with pytest.raises(BadParameterCount):
+        getattr(ISA("lccfq"), gate)(tg=0, params=params)
+
+
+@pytest.mark.parametrize("gate,params", [("rx", 0.5), ("u3", 1), ("u2", 2.0), ("rx", (0.5,))])
+def test_sqg_par_non_list_params_raise(gate, params):
+    with pytest.raises(BadParameterCount):
+        getattr(ISA("lccfq"), gate)(tg=0, params=params)
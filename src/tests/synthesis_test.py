@@ -49,6 +49,13 @@ def test_tqg(synth):
     assert qasm.strip() == "cx q[0] , q[1];"
 
 
+def test_tqg_par(synth):
+    instr = Instruction(symbol="cu", control_qubits=[2], target_qubits=[1], params=[0.5, 1/3, 2.0])
+    assert synth.synth_instruction(instr) == "cu(0.5, 0.3333333333, 2) q[2] , q[1];"
+    # Qubit references are reused across instructions without leaking between them
+    assert synth.synth_instruction(Instruction(symbol="h", target_qubits=[2])) == "h q[2];"
+
+
 def test_measurement(synth):
     instr = Instruction(symbol="measure", target_qubits=[0, 1])
     qasm = synth.synth_instruction(instr)
@@ -91,4 +98,22 @@ def test_full_circuit_translation(synth):
     assert "x q[0];" in qasm
     assert "cx q[0] , q[1];" in qasm
     assert "measure q[0] -> c[0];" in qasm
-    assert "measure q[1] -> c[1];" in qasm
\ No newline at end of file
+    assert "measure q[1] -> c[1];" in qasm
+
+
+def test_circuit_to_file_matches_synth_circuit(synth, tmp_path):
+    qpu = QPU(filename="src/tests/data/testing.toml")
+    qreg = qpu.qregister(2)
+    creg = CRegister(2)
+
+    with Circuit(qreg, creg, qpu) as c:
+        c >> Instruction(symbol="h", target_qubits=[0])
+        c >> Instruction(symbol="rz", target_qubits=[1], params=[0.25])
+        c >> Instruction(symbol="cx", control_qubits=[0], target_qubits=[1])
+        c >> Instruction(symbol="measure", target_qubits=[0, 1])
+
+    expected = synth.synth_circuit(circuit=c)
+    path = tmp_path / "out" / "circuit.qasm"
+    synth.synth_circuit_to_file(c, str(path))
+
+    assert path.read_text() == expected
@@ -12,6 +12,9 @@ License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
 import importlib
+import os
+import subprocess
+import sys
 
 # (top-level name, fully-qualified module path) pairs
 EXPECTED = [
@@ -78,3 +81,26 @@ def test_star_import_exposes_all_names():
     pkg = importlib.import_module("lccfq_lang")
     missing = [n for n in pkg.__all__ if n not in ns]
     assert not missing, f"`import *` did not expose: {missing}"
+
+
+def test_reexports_are_lazy():
+    """Importing the package and a lightweight name must not load the backend."""
+    code = (
+        "import sys\n"
+        "from lccfq_lang import ISA\n"
+        "assert 'lccfq_lang.backend' not in sys.modules\n"
+        "assert 'lccfq_lang.opt' not in sys.modules\n"
+    )
+    src = os.path.dirname(importlib.import_module("lccfq_lang").__path__[0])
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   env={**os.environ, "PYTHONPATH": src})
+
+
+def test_unknown_attribute_raises():
+    pkg = importlib.import_module("lccfq_lang")
+    try:
+        pkg.does_not_exist
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("expected AttributeError")
@@ -154,4 +154,28 @@ def test_bad_topology_type_raises():
     }
 
     with pytest.raises(BadTopologyType):
-        _ = QPUTopology(QPUConfig(bad_spec))
\ No newline at end of file
+        _ = QPUTopology(QPUConfig(bad_spec))
+
+
+def test_shortest_path_table_matches_networkx(linear_spec):
+    topo = QPUTopology(QPUConfig(linear_spec))
+
+    for a in topo.qubits():
+        for b in topo.qubits():
+            assert topo.shortest_path(a, b) == nx.shortest_path(topo.internal, a, b)
+
+    assert topo.shortest_path(0, 3) is topo.shortest_path(0, 3)
+
+
+def test_needs_swap_matches_swaps(linear_spec, isa):
+    topo = QPUTopology(QPUConfig(linear_spec))
+
+    assert not topo.needs_swap(Instruction("x", target_qubits=[3]))
+    assert not topo.needs_swap(isa.measure(tgs=[0, 3]))
+    assert not topo.needs_swap(Instruction("cx", control_qubits=[1], target_qubits=[2]))
+    assert topo.needs_swap(Instruction("cx", control_qubits=[0], target_qubits=[3]))
+    assert topo.needs_swap(Instruction("dummy", target_qubits=[0, 1, 2]))
+
+    for ct, tg in [(0, 1), (0, 2), (3, 0), (1, 3)]:
+        instr = Instruction("cx", control_qubits=[ct], target_qubits=[tg])
+        assert topo.needs_swap(instr) == (topo.swaps(instr, isa) != [instr])
@@ -9,9 +9,12 @@ Description:
 License: Apache 2.0
 Contact: nunezco2@illinois.edu
 """
+import numpy as np
 import pytest
 from math import pi as PI
+from lccfq_lang.arch.columns import InstructionColumns
 from lccfq_lang.arch.instruction import Instruction
+from lccfq_lang.arch.isa import ISA
 from lccfq_lang.sys.factories.mach import TranspilerFactory
 from lccfq_lang.mach.ir import Gate
 
@@ -28,6 +31,35 @@ two_qubit_gates = [
     ("swap", []),
 ]
 
+# Routing directives in the transpilation table: which instruction operands
+# become a gate's targets and controls.
+ROUTES = {
+    ".": lambda i: (i.target_qubits, None),
+    "t": lambda i: (i.target_qubits, None),
+    "c": lambda i: (i.control_qubits, None),
+    "*": lambda i: (i.target_qubits, i.control_qubits),
+    "+": lambda i: (i.control_qubits, i.target_qubits),
+}
+
+
+def reference_gates(table, instr):
+    """Expand an instruction by walking its table entry directly, as a
+    reference for the precompiled plans used by transpile_gate."""
+    gates = []
+
+    for symbol, params, route in table[instr.symbol]:
+        tq, cq = ROUTES[route](instr)
+
+        if callable(params):
+            params = list(params(instr.params or []))
+        elif params is None:
+            params = instr.params
+
+        gates.append(Gate(symbol=symbol, target_qubits=tq, control_qubits=cq, params=params))
+
+    return gates
+
+
 @pytest.mark.parametrize("symbol,params", two_qubit_gates)
 def test_two_qubit_transpilation(symbol, params):
     instr = Instruction(
@@ -51,3 +83,67 @@ def test_two_qubit_transpilation(symbol, params):
     for gate in gates:
         if gate.symbol in ["rx", "ry", "rz"] and gate.params is not None:
             assert all(isinstance(p, float) for p in gate.params)
+
+
+@pytest.mark.parametrize("symbol,params", two_qubit_gates)
+def test_two_qubit_transpilation_matches_synthesis(symbol, params):
+    instr = Instruction(
+        symbol=symbol,
+        target_qubits=[1],
+        control_qubits=[0],
+        params=params,
+        is_controlled=True
+    )
+
+    transpiler = TranspilerFactory().get(mach="pfaff_v1")
+    expected = reference_gates(transpiler._table, instr)
+    gates = transpiler.transpile_gate(instr)
+
+    assert [(g.symbol, g.target_qubits, g.control_qubits, g.params) for g in gates] == \
+           [(g.symbol, g.target_qubits, g.control_qubits, g.params) for g in expected]
+
+
+def test_derived_params_reused_across_repeated_gates():
+    transpiler = TranspilerFactory().get(mach="pfaff_v1")
+    first = transpiler.transpile_gate(Instruction("crz", target_qubits=[1], control_qubits=[0], params=[PI/7]))
+    again = transpiler.transpile_gate(Instruction("crz", target_qubits=[3], control_qubits=[2], params=[PI/7]))
+    other = transpiler.transpile_gate(Instruction("crz", target_qubits=[1], control_qubits=[0], params=[PI/9]))
+
+    derived = [k for k, entry in enumerate(transpiler._table["crz"]) if callable(entry[1])]
+    assert derived
+    assert all(first[k].params is again[k].params for k in derived)
+    assert all(first[k].params != other[k].params for k in derived)
+
+
+def test_transpiled_gates_use_slots():
+    transpiler = TranspilerFactory().get(mach="pfaff_v1")
+    gates = transpiler.transpile_gate(Instruction("cx", target_qubits=[1], control_qubits=[0]))
+
+    assert not any(hasattr(g, "__dict__") for g in gates)
+
+    with pytest.raises(AttributeError):
+        gates[0].unknown_field = 1
+
+
+def test_transpile_columns_matches_transpile_gate():
+    isa = ISA("test")
+    transpiler = TranspilerFactory().get(mach="pfaff_v1")
+    program = [
+        isa.h(tg=0), isa.cx(ct=0, tg=1), isa.rx(tg=2, params=[PI/5]),
+        isa.crz(ct=1, tg=2, params=[PI/7]), isa.swap(tg_a=0, tg_b=2),
+        isa.cp(ct=2, tg=0, params=[PI/3]), isa.crz(ct=0, tg=1, params=[PI/7]),
+    ]
+
+    cols = transpiler.transpile_columns(InstructionColumns.from_instructions(program))
+    expected = InstructionColumns.from_instructions(
+        [g for instr in program for g in transpiler.transpile_gate(instr)])
+
+    assert cols.symbols.tolist() == expected.symbols.tolist()
+    assert cols.targets.tolist() == expected.targets.tolist()
+    assert cols.controls.tolist() == expected.controls.tolist()
+    assert np.array_equal(cols.params, expected.params, equal_nan=True)
+
+
+def test_transpile_columns_empty():
+    transpiler = TranspilerFactory().get(mach="pfaff_v1")
+    assert len(transpiler.transpile_columns(InstructionColumns.from_instructions([]))) == 0
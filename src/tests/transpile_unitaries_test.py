@@ -309,7 +309,7 @@ def test_cx_reversed_control_target():
 
 
 # ---------------------------------------------------------------------------
-# Callable params regression test (_synthesize extension)
+# Callable params regression test (derived-angle table entries)
 # ---------------------------------------------------------------------------
 
 def test_synthesize_callable_params():
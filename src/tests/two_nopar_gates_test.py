@@ -27,4 +27,14 @@ def test_tqcg_no_par_gen(gate):
     assert instr.target_qubits == [1]
     assert instr.control_qubits == [0]
     assert instr.params is None
-    assert instr.shots == 1
\ No newline at end of file
+    assert instr.shots == 1
+
+
+@pytest.mark.parametrize("gate", ["cx", "cy", "cz", "ch"])
+def test_tqcg_no_par_interned(gate):
+    isa = ISA("lccfq")
+    method = getattr(isa, gate)
+
+    assert method(ct=0, tg=1) is method(ct=0, tg=1)
+    assert method(ct=0, tg=1) is not method(ct=1, tg=0)
+    assert method(ct=0, tg=1, shots=10) is not method(ct=0, tg=1, shots=10)
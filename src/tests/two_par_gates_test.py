@@ -11,6 +11,7 @@ Contact: nunezco2@illinois.edu
 """
 import pytest
 
+from lccfq_lang.arch.error import BadParameterCount
 from lccfq_lang.arch.isa import ISA
 from lccfq_lang.arch.instruction import Instruction
 
@@ -33,4 +34,23 @@ def test_tqcg_par_gen(gate):
     assert instr.target_qubits == [1]
     assert instr.control_qubits == [0]
     assert instr.params == [0.0] or instr.params == [0.0, 0.1, 0.2, 0.3]
-    assert instr.shots == 1
\ No newline at end of file
+    assert instr.shots == 1
+
+
+def test_tqcg_par_arity():
+    isa = ISA("lccfq")
+    assert isa.cu(ct=0, tg=1, params=[0.1, 0.2, 0.3]).params == [0.1, 0.2, 0.3]
+
+    with pytest.raises(BadParameterCount):
+        isa.crz(ct=0, tg=1, params=[0.1, 0.2])
+
+    with pytest.raises(BadParameterCount):
+        isa.cu(ct=0, tg=1, params=[0.1])
+
+
+def test_tqcg_par_non_list_params_raise():
+    with pytest.raises(BadParameterCount):
+        ISA("lccfq").crz(ct=0, tg=1, params=0.5)
+
+    with pytest.raises(BadParameterCount):
+        ISA("lccfq").crz(ct=0, tg=1, params=(0.5,))